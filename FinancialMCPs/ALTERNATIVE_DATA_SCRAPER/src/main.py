@@ -1,28 +1,44 @@
 import time
 #!/usr/bin/env python
 
-import json
 import asyncio
+import io
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 import re
-from urllib.parse import urljoin, quote, urlparse
+from urllib.parse import urljoin, quote
 
 import aiohttp
-from bs4 import BeautifulSoup
+import lxml.html
+import orjson
+from lxml import etree
+from bs4 import BeautifulSoup, SoupStrainer
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.types import Tool, TextContent
 import mcp.server.stdio as stdio
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 import asyncio
-from functools import wraps
+from collections import Counter, OrderedDict
+from functools import partial, wraps
+from itertools import islice
 
 # Import advanced modules
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent / "shared"))
+from data_cache import FinancialDataCache
+
+# One pooled session serves every tool call, so bound each request instead of the session
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=20, connect=5)
 
+# Scrape outputs move on hour/day timescales, so keep them across server restarts
+disk_cache = FinancialDataCache()
 
 
 def async_retry(max_attempts=3, delay=1):
@@ -44,52 +60,241 @@ def async_retry(max_attempts=3, delay=1):
     return decorator
 
 
+# Keyword classifiers compiled once; each pattern matches the same substrings the
+# original keyword lists did, in the same priority order
+_JOB_CATEGORIES = [
+    ('Engineering', re.compile('engineer|developer|programmer|software')),
+    ('Sales', re.compile('sales|account|business development')),
+    ('Marketing', re.compile('marketing|brand|content|social media')),
+    ('Data/Analytics', re.compile('data|analyst|scientist|analytics')),
+    ('Product', re.compile('product|manager|pm')),
+    ('Finance', re.compile('finance|accounting|controller')),
+    ('HR/Recruiting', re.compile('hr|human resources|recruiting|talent')),
+    ('Operations', re.compile('operations|supply chain|logistics')),
+]
+
+_PATENT_CATEGORIES = [
+    ('AI/ML', re.compile('ai|artificial intelligence|machine learning|neural')),
+    ('Blockchain', re.compile('blockchain|cryptocurrency|distributed ledger')),
+    ('Cloud/Infrastructure', re.compile('cloud|server|datacenter|infrastructure')),
+    ('Mobile', re.compile('mobile|smartphone|app|ios|android')),
+    ('Security', re.compile('security|encryption|authentication|privacy')),
+    ('IoT', re.compile('iot|sensor|connected device|smart')),
+    ('Healthcare', re.compile('biotech|pharma|medical|health')),
+]
+
+# Scalar fields read straight off the raw response bytes, no DOM needed
+_JOBS_COUNT_RX = re.compile(rb'id="searchCountPages"[^>]*>[^<]*?of\s+([\d,]+)\s+jobs')
+_GLASSDOOR_RATING_RX = re.compile(rb'v2__EIReviewsRatingsStylesV2__ratingNum[^"]*"[^>]*>\s*([\d.]+)\s*<')
+
+def _class_token_rx(*class_names: str) -> re.Pattern:
+    """Match a class attribute containing any of the given class tokens"""
+    return re.compile(r'(?:^|\s)(?:%s)(?:\s|$)' % '|'.join(map(re.escape, class_names)))
+
+
+# Only the subtrees each BeautifulSoup scraper reads get materialized
+_APP_STRAINER = SoupStrainer('div', class_=_class_token_rx('rating', 'alternative'))
+_GLASSDOOR_REVIEW_STRAINER = SoupStrainer('div', class_=_class_token_rx('review'))
+_SEARCH_RESULT_STRAINER = SoupStrainer('div', class_=_class_token_rx('g'))
+
+# Whole words only, so e.g. "buyer" or "shortage" do not count as signals
+_BULLISH_RX = re.compile(r'\b(?:moon|rocket|buy|calls|yolo|gains|tendies|bullish|long)\b')
+_BEARISH_RX = re.compile(r'\b(?:puts|short|crash|dump|bearish|sell|loss|bag)\b')
+
+# Shared read-only default for missing data_points sections
+_EMPTY: Dict[str, Any] = {}
+
+
+def async_ttl_cache(maxsize=512, ttl=600, disk_ttl: Optional[timedelta] = None):
+    """TTL/LRU cache for async methods; concurrent callers with the same arguments share one in-flight task.
+    
+    With disk_ttl, results are also persisted in the shared FinancialDataCache. Callers may pass
+    force_refresh=True to bypass both layers and store a fresh result.
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        
+        async def load_or_call(args, kwargs, force_refresh):
+            if disk_ttl is None:
+                return await func(*args, **kwargs)
+            
+            # Key on the arguments after self, which is not stable across processes
+            subject, params = str(args[1]), {'args': args[2:], 'kwargs': kwargs}
+            if not force_refresh:
+                # sqlite + pickle block, so keep them off the event loop
+                cached = await asyncio.to_thread(disk_cache.get_sync, func.__name__, subject, params)
+                if cached is not None:
+                    return cached
+            
+            result = await func(*args, **kwargs)
+            if not (isinstance(result, dict) and 'error' in result):
+                await asyncio.to_thread(disk_cache.set_sync, func.__name__, subject, result, params, disk_ttl)
+            return result
+        
+        def evict_failed(key, task):
+            # Only successful scrapes are worth keeping
+            failed = task.cancelled() or task.exception() is not None
+            if not failed:
+                result = task.result()
+                failed = isinstance(result, dict) and 'error' in result
+            if failed and key in cache and cache[key][1] is task:
+                del cache[key]
+        
+        @wraps(func)
+        async def wrapper(*args, force_refresh: bool = False, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            entry = cache.get(key)
+            
+            if entry and entry[0] > now and not force_refresh:
+                cache.move_to_end(key)
+                task = entry[1]
+            else:
+                task = asyncio.ensure_future(load_or_call(args, kwargs, force_refresh))
+                task.add_done_callback(partial(evict_failed, key))
+                cache[key] = (now + ttl, task)
+                cache.move_to_end(key)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            
+            result = await asyncio.shield(task)
+            # Callers annotate results in place, so hand each one its own top-level dict
+            return dict(result) if isinstance(result, dict) else result
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+class TokenBucket:
+    """Per-host token bucket: allows bursts up to `capacity` while holding the average request rate"""
+    
+    def __init__(self, capacity: float = 5, refill_per_sec: float = 1.0):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+    
+    async def acquire(self):
+        """Take a token, sleeping until it is refilled when the bucket is empty"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_per_sec)
+        self.last_refill = now
+        
+        # Reserve the token before sleeping so concurrent callers queue behind each other
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.refill_per_sec)
+
+
+def _class_xpath(tag: str, class_name: str) -> str:
+    """Build a relative XPath matching `tag` elements carrying the CSS class `class_name`"""
+    return f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+def _parse_html(body: bytes, charset: Optional[str] = None):
+    """Build an lxml tree straight from response bytes, skipping a separate str decode"""
+    parser = lxml.html.HTMLParser(encoding=charset) if charset else None
+    return lxml.html.fromstring(body, parser=parser)
+
+
+def _parse_patent_items(body: bytes, charset: Optional[str] = None, limit: int = 20) -> List[Dict[str, str]]:
+    """Stream Google Patents result items out of the page without building the whole tree"""
+    patents = []
+    items = etree.iterparse(
+        io.BytesIO(body),
+        events=('end',),
+        tag='search-result-item',
+        html=True,
+        encoding=charset or 'utf-8'
+    )
+    
+    for _, item in islice(items, limit):
+        title = _first_text(item, _class_xpath('h3', 'result-title'))
+        
+        if title is not None:
+            patents.append({
+                'title': title,
+                'date': _first_text(item, _class_xpath('span', 'result-date')) or '',
+                'abstract': (_first_text(item, _class_xpath('span', 'result-abstract')) or '')[:200]
+            })
+        
+        # Free the processed item and any siblings parsed before it
+        item.clear()
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+    
+    return patents
+
+
+def _first_text(node, *paths: str) -> Optional[str]:
+    """Return the stripped text of the first element matched by any of the XPath expressions"""
+    for path in paths:
+        found = node.xpath(path)
+        if found:
+            return ''.join(found[0].itertext()).strip()
+    return None
+
+
 
 class AlternativeDataScraper:
     """Scraper for alternative data sources: job postings, web traffic, app rankings, patents, etc."""
     
     def __init__(self):
         self.session: Optional[aiohttp.ClientSession] = None
-        self.last_request_time = {}
+        self.rate_limiters: Dict[str, TokenBucket] = {}
 
         # Initialize advanced components
         self.analysis_enhanced = True
-        self.min_delay = 1.0  # Rate limiting
+        self.requests_per_second = 1.0  # Rate limiting
+        self.burst = 5
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept-Encoding': 'gzip, deflate, br'
         }
 
-    async def rate_limit(self, url: str):
+    async def rate_limit(self, domain: str):
         """Implement rate limiting per domain"""
-        from urllib.parse import urlparse
-        domain = urlparse(url).netloc
-        
-        if domain in self.last_request_time:
-            elapsed = time.time() - self.last_request_time[domain]
-            if elapsed < self.min_delay:
-                await asyncio.sleep(self.min_delay - elapsed)
+        bucket = self.rate_limiters.get(domain)
+        if bucket is None:
+            bucket = self.rate_limiters[domain] = TokenBucket(self.burst, self.requests_per_second)
         
-        self.last_request_time[domain] = time.time()
+        await bucket.acquire()
             
     async def setup(self):
-        """Setup aiohttp session"""
+        """Setup the shared aiohttp session with a keep-alive connection pool"""
         if not self.session or self.session.closed:
-            self.session = aiohttp.ClientSession(headers=self.headers)
+            connector = aiohttp.TCPConnector(
+                resolver=aiohttp.AsyncResolver(),
+                limit=0,
+                limit_per_host=8,
+                use_dns_cache=True,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                timeout=REQUEST_TIMEOUT
+            )
     
     async def cleanup(self):
-        """Cleanup aiohttp session"""
+        """Cleanup aiohttp session on server shutdown"""
         if self.session:
             await self.session.close()
     
+    @async_ttl_cache(disk_ttl=timedelta(hours=1))
     async def scrape_indeed_jobs(self, company: str) -> Dict[str, Any]:
         """Scrape job postings from Indeed to gauge hiring trends"""
         query = quote(f'company:"{company}"')
         url = f"https://www.indeed.com/jobs?q={query}&sort=date"
         
         try:
+            await self.rate_limit('www.indeed.com')
             async with self.session.get(url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
+                response.raise_for_status()
+                body = await response.read()
                 
                 job_data = {
                     'company': company,
@@ -102,38 +307,43 @@ class AlternativeDataScraper:
                 }
                 
                 # Extract job count
-                count_elem = soup.find('div', {'id': 'searchCountPages'})
-                if count_elem:
-                    count_text = count_elem.text
-                    match = re.search(r'of\s+([\d,]+)\s+jobs', count_text)
-                    if match:
-                        job_data['total_jobs'] = int(match.group(1).replace(',', ''))
+                match = _JOBS_COUNT_RX.search(body)
+                if match:
+                    job_data['total_jobs'] = int(match.group(1).replace(b',', b''))
+                
+                tree = await asyncio.to_thread(_parse_html, body, response.charset)
+                del body
                 
                 # Extract job listings
-                job_cards = soup.find_all('div', {'class': re.compile('job_seen_beacon|jobsearch-SerpJobCard')})
+                job_categories = Counter()
+                locations = Counter()
+                job_cards = tree.xpath(
+                    "//div[contains(@class, 'job_seen_beacon') or contains(@class, 'jobsearch-SerpJobCard')]"
+                )
                 
                 for card in job_cards[:20]:  # Get top 20 recent jobs
-                    title_elem = card.find('h2', {'class': 'jobTitle'}) or card.find('a', {'data-testid': 'job-title'})
-                    location_elem = card.find('div', {'data-testid': 'job-location'}) or card.find('span', {'class': 'locationsContainer'})
-                    date_elem = card.find('span', {'class': 'date'})
+                    job_title = _first_text(card, _class_xpath('h2', 'jobTitle'), ".//a[@data-testid='job-title']")
+                    location = _first_text(card, ".//div[@data-testid='job-location']", _class_xpath('span', 'locationsContainer'))
+                    posted = _first_text(card, _class_xpath('span', 'date'))
                     
-                    if title_elem:
-                        job_title = title_elem.text.strip()
-                        location = location_elem.text.strip() if location_elem else 'Unknown'
+                    if job_title is not None:
+                        location = location if location is not None else 'Unknown'
                         
                         job_data['recent_postings'].append({
                             'title': job_title,
                             'location': location,
-                            'posted': date_elem.text.strip() if date_elem else 'Unknown'
+                            'posted': posted if posted is not None else 'Unknown'
                         })
                         
                         # Categorize jobs
                         job_category = self._categorize_job(job_title)
-                        job_data['job_categories'][job_category] = job_data['job_categories'].get(job_category, 0) + 1
+                        job_categories[job_category] += 1
                         
                         # Track locations
-                        job_data['locations'][location] = job_data['locations'].get(location, 0) + 1
+                        locations[location] += 1
                 
+                job_data['job_categories'] = dict(job_categories)
+                job_data['locations'] = dict(locations)
                 return job_data
         
         except Exception as e:
@@ -143,34 +353,22 @@ class AlternativeDataScraper:
         """Categorize job based on title keywords"""
         title_lower = job_title.lower()
         
-        if any(word in title_lower for word in ['engineer', 'developer', 'programmer', 'software']):
-            return 'Engineering'
-        elif any(word in title_lower for word in ['sales', 'account', 'business development']):
-            return 'Sales'
-        elif any(word in title_lower for word in ['marketing', 'brand', 'content', 'social media']):
-            return 'Marketing'
-        elif any(word in title_lower for word in ['data', 'analyst', 'scientist', 'analytics']):
-            return 'Data/Analytics'
-        elif any(word in title_lower for word in ['product', 'manager', 'pm']):
-            return 'Product'
-        elif any(word in title_lower for word in ['finance', 'accounting', 'controller']):
-            return 'Finance'
-        elif any(word in title_lower for word in ['hr', 'human resources', 'recruiting', 'talent']):
-            return 'HR/Recruiting'
-        elif any(word in title_lower for word in ['operations', 'supply chain', 'logistics']):
-            return 'Operations'
-        else:
-            return 'Other'
+        for category, pattern in _JOB_CATEGORIES:
+            if pattern.search(title_lower):
+                return category
+        return 'Other'
     
+    @async_ttl_cache(disk_ttl=timedelta(hours=1))
     async def scrape_similarweb_traffic(self, domain: str) -> Dict[str, Any]:
         """Scrape web traffic estimates from SimilarWeb"""
         clean_domain = domain.replace('https://', '').replace('http://', '').replace('www.', '').split('/')[0]
         url = f"https://www.similarweb.com/website/{clean_domain}/"
         
         try:
+            await self.rate_limit('www.similarweb.com')
             async with self.session.get(url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
+                response.raise_for_status()
+                tree = await asyncio.to_thread(_parse_html, await response.read(), response.charset)
                 
                 traffic_data = {
                     'domain': clean_domain,
@@ -182,32 +380,31 @@ class AlternativeDataScraper:
                 }
                 
                 # Extract traffic metrics
-                metric_elements = soup.find_all('div', {'class': re.compile('engagement-list__item')})
+                metric_elements = tree.xpath("//div[contains(@class, 'engagement-list__item')]")
                 for elem in metric_elements:
-                    title = elem.find('p', {'class': 'engagement-list__item-title'})
-                    value = elem.find('p', {'class': 'engagement-list__item-value'})
+                    metric_name = _first_text(elem, _class_xpath('p', 'engagement-list__item-title'))
+                    metric_value = _first_text(elem, _class_xpath('p', 'engagement-list__item-value'))
                     
-                    if title and value:
-                        metric_name = title.text.strip()
-                        metric_value = value.text.strip()
+                    if metric_name is not None and metric_value is not None:
                         traffic_data['metrics'][metric_name] = metric_value
                 
                 # Extract traffic sources
-                sources_section = soup.find('div', {'data-test': 'traffic-sources'})
+                sources_section = tree.xpath("//div[@data-test='traffic-sources']")
                 if sources_section:
-                    source_items = sources_section.find_all('div', {'class': 'wa-traffic-sources__item'})
+                    source_items = sources_section[0].xpath(_class_xpath('div', 'wa-traffic-sources__item'))
                     for item in source_items:
-                        source_name = item.find('a', {'class': 'wa-traffic-sources__title'})
-                        source_value = item.find('span', {'class': 'wa-traffic-sources__value'})
+                        source_name = _first_text(item, _class_xpath('a', 'wa-traffic-sources__title'))
+                        source_value = _first_text(item, _class_xpath('span', 'wa-traffic-sources__value'))
                         
-                        if source_name and source_value:
-                            traffic_data['traffic_sources'][source_name.text.strip()] = source_value.text.strip()
+                        if source_name is not None and source_value is not None:
+                            traffic_data['traffic_sources'][source_name] = source_value
                 
                 return traffic_data
         
         except Exception as e:
             return {'error': f"Failed to scrape SimilarWeb data: {str(e)}"}
     
+    @async_ttl_cache(disk_ttl=timedelta(hours=1))
     async def scrape_app_rankings(self, app_name: str, company: str) -> Dict[str, Any]:
         """Scrape app store rankings and reviews"""
         # Using AppAnnie/data.ai style scraping (simplified)
@@ -227,40 +424,44 @@ class AlternativeDataScraper:
         alternative_url = f"https://alternativeto.net/software/{search_query.replace(' ', '-').lower()}/"
         
         try:
+            await self.rate_limit('alternativeto.net')
             async with self.session.get(alternative_url) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Extract ratings
-                    rating_elem = soup.find('div', {'class': 'rating'})
-                    if rating_elem:
-                        app_data['ratings']['overall'] = rating_elem.text.strip()
-                    
-                    # Extract alternatives (competitors)
-                    alternatives = []
-                    alt_items = soup.find_all('div', {'class': 'alternative'})[:10]
-                    for item in alt_items:
-                        name = item.find('h3')
-                        if name:
-                            alternatives.append(name.text.strip())
-                    
-                    app_data['competitors'] = alternatives
+                response.raise_for_status()
+                html = (await response.read()).decode(response.charset or 'utf-8', 'replace')
+                soup = await asyncio.to_thread(BeautifulSoup, html, 'lxml', parse_only=_APP_STRAINER)
+                del html
+                
+                # Extract ratings
+                rating_elem = soup.find('div', {'class': 'rating'})
+                if rating_elem:
+                    app_data['ratings']['overall'] = rating_elem.text.strip()
+                
+                # Extract alternatives (competitors)
+                alternatives = []
+                alt_items = soup.find_all('div', {'class': 'alternative'})[:10]
+                for item in alt_items:
+                    name = item.find('h3')
+                    if name:
+                        alternatives.append(name.text.strip())
+                
+                app_data['competitors'] = alternatives
         
         except Exception as e:
             app_data['error'] = f"Failed to scrape app data: {str(e)}"
         
         return app_data
     
+    @async_ttl_cache(disk_ttl=timedelta(hours=1))
     async def scrape_patent_activity(self, company: str) -> Dict[str, Any]:
         """Scrape patent filing activity from Google Patents"""
         query = quote(f'assignee:"{company}"')
         url = f"https://patents.google.com/?assignee={query}&sort=new"
         
         try:
+            await self.rate_limit('patents.google.com')
             async with self.session.get(url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
+                response.raise_for_status()
+                body = await response.read()
                 
                 patent_data = {
                     'company': company,
@@ -271,27 +472,18 @@ class AlternativeDataScraper:
                     'timestamp': datetime.now().isoformat()
                 }
                 
-                # Extract patent listings
-                patent_items = soup.find_all('search-result-item')[:20]
+                # Parse off the event loop so concurrent scrapes keep making progress
+                patent_items = await asyncio.to_thread(_parse_patent_items, body, response.charset)
                 
-                for item in patent_items:
-                    title_elem = item.find('h3', {'class': 'result-title'})
-                    date_elem = item.find('span', {'class': 'result-date'})
-                    abstract_elem = item.find('span', {'class': 'result-abstract'})
+                technology_areas = Counter()
+                for patent_info in patent_items:
+                    patent_data['recent_patents'].append(patent_info)
                     
-                    if title_elem:
-                        patent_info = {
-                            'title': title_elem.text.strip(),
-                            'date': date_elem.text.strip() if date_elem else '',
-                            'abstract': abstract_elem.text.strip()[:200] if abstract_elem else ''
-                        }
-                        
-                        patent_data['recent_patents'].append(patent_info)
-                        
-                        # Categorize by technology area
-                        tech_area = self._categorize_patent(patent_info['title'], patent_info['abstract'])
-                        patent_data['technology_areas'][tech_area] = patent_data['technology_areas'].get(tech_area, 0) + 1
+                    # Categorize by technology area
+                    tech_area = self._categorize_patent(patent_info['title'], patent_info['abstract'])
+                    technology_areas[tech_area] += 1
                 
+                patent_data['technology_areas'] = dict(technology_areas)
                 return patent_data
         
         except Exception as e:
@@ -301,32 +493,22 @@ class AlternativeDataScraper:
         """Categorize patent based on title and abstract"""
         text = (title + ' ' + abstract).lower()
         
-        if any(word in text for word in ['ai', 'artificial intelligence', 'machine learning', 'neural']):
-            return 'AI/ML'
-        elif any(word in text for word in ['blockchain', 'cryptocurrency', 'distributed ledger']):
-            return 'Blockchain'
-        elif any(word in text for word in ['cloud', 'server', 'datacenter', 'infrastructure']):
-            return 'Cloud/Infrastructure'
-        elif any(word in text for word in ['mobile', 'smartphone', 'app', 'ios', 'android']):
-            return 'Mobile'
-        elif any(word in text for word in ['security', 'encryption', 'authentication', 'privacy']):
-            return 'Security'
-        elif any(word in text for word in ['iot', 'sensor', 'connected device', 'smart']):
-            return 'IoT'
-        elif any(word in text for word in ['biotech', 'pharma', 'medical', 'health']):
-            return 'Healthcare'
-        else:
-            return 'Other'
+        for category, pattern in _PATENT_CATEGORIES:
+            if pattern.search(text):
+                return category
+        return 'Other'
     
-    async def scrape_glassdoor_sentiment(self, company: str) -> Dict[str, Any]:
-        """Scrape employee sentiment from Glassdoor"""
+    @async_ttl_cache(disk_ttl=timedelta(hours=1))
+    async def scrape_glassdoor_sentiment(self, company: str, include_reviews: bool = True) -> Dict[str, Any]:
+        """Scrape employee sentiment from Glassdoor; without reviews the page is never parsed"""
         search_query = quote(company)
         url = f"https://www.glassdoor.com/Search/results.htm?keyword={search_query}"
         
         try:
+            await self.rate_limit('www.glassdoor.com')
             async with self.session.get(url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
+                response.raise_for_status()
+                body = await response.read()
                 
                 sentiment_data = {
                     'company': company,
@@ -338,20 +520,29 @@ class AlternativeDataScraper:
                 }
                 
                 # Extract overall rating
-                rating_elem = soup.find('div', {'class': 'v2__EIReviewsRatingsStylesV2__ratingNum'})
-                if rating_elem:
-                    sentiment_data['ratings']['overall'] = rating_elem.text.strip()
+                match = _GLASSDOOR_RATING_RX.search(body)
+                if match:
+                    rating_text = match.group(1).decode()
+                    sentiment_data['ratings']['overall'] = rating_text
                     
                     # Determine sentiment based on rating
                     try:
-                        rating_value = float(rating_elem.text.strip())
+                        rating_value = float(rating_text)
                         if rating_value >= 4.0:
                             sentiment_data['employee_sentiment'] = 'positive'
                         elif rating_value <= 3.0:
                             sentiment_data['employee_sentiment'] = 'negative'
-                    except:
+                    except ValueError:
                         pass
                 
+                if not include_reviews:
+                    return sentiment_data
+                
+                html = body.decode(response.charset or 'utf-8', 'replace')
+                del body
+                soup = await asyncio.to_thread(BeautifulSoup, html, 'lxml', parse_only=_GLASSDOOR_REVIEW_STRAINER)
+                del html
+                
                 # Extract review snippets
                 review_elements = soup.find_all('div', {'class': 'review'})[:5]
                 for review in review_elements:
@@ -383,32 +574,40 @@ class AlternativeDataScraper:
             'timestamp': datetime.now().isoformat()
         }
         
-        for subreddit in subreddits:
-            url = f"https://www.reddit.com/r/{subreddit}/search.json?q={quote(search_term)}&sort=new&limit=25"
-            
-            try:
-                async with self.session.get(url, headers={'User-Agent': 'Alternative Data Scraper 1.0'}) as response:
-                    if response.status == 200:
-                        data = await response.json()
+        sentiment_summary = Counter()
+        
+        # One search across all subreddits instead of a round-trip per subreddit
+        url = (
+            f"https://www.reddit.com/r/{'+'.join(subreddits)}/search.json"
+            f"?q={quote(search_term)}&sort=new&limit=100&restrict_sr=true"
+        )
+        
+        try:
+            await self.rate_limit('www.reddit.com')
+            async with self.session.get(url, headers={'User-Agent': 'Alternative Data Scraper 1.0'}) as response:
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    
+                    for post in data['data']['children']:
+                        post_data = post['data']
                         
-                        for post in data['data']['children']:
-                            post_data = post['data']
-                            
-                            reddit_data['mentions'].append({
-                                'title': post_data['title'],
-                                'score': post_data['score'],
-                                'num_comments': post_data['num_comments'],
-                                'created': datetime.fromtimestamp(post_data['created_utc']).isoformat(),
-                                'subreddit': post_data['subreddit'],
-                                'url': f"https://reddit.com{post_data['permalink']}"
-                            })
-                            
-                            # Simple sentiment based on title
-                            sentiment = self._analyze_reddit_sentiment(post_data['title'])
-                            reddit_data['sentiment_summary'][sentiment] = reddit_data['sentiment_summary'].get(sentiment, 0) + 1
-            
-            except Exception as e:
-                continue
+                        reddit_data['mentions'].append({
+                            'title': post_data['title'],
+                            'score': post_data['score'],
+                            'num_comments': post_data['num_comments'],
+                            'created': time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(post_data['created_utc'])),
+                            'subreddit': post_data['subreddit'],
+                            'url': f"https://reddit.com{post_data['permalink']}"
+                        })
+                        
+                        # Simple sentiment based on title
+                        sentiment = self._analyze_reddit_sentiment(post_data['title'])
+                        sentiment_summary[sentiment] += 1
+        
+        except Exception:
+            pass
+        
+        reddit_data['sentiment_summary'] = dict(sentiment_summary)
         
         # Check if trending
         if len(reddit_data['mentions']) > 10:
@@ -420,11 +619,8 @@ class AlternativeDataScraper:
         """Simple sentiment analysis for Reddit posts"""
         text_lower = text.lower()
         
-        bullish_terms = ['moon', 'rocket', 'buy', 'calls', 'yolo', 'gains', 'tendies', 'bullish', 'long']
-        bearish_terms = ['puts', 'short', 'crash', 'dump', 'bearish', 'sell', 'loss', 'bag']
-        
-        bullish_score = sum(1 for term in bullish_terms if term in text_lower)
-        bearish_score = sum(1 for term in bearish_terms if term in text_lower)
+        bullish_score = len(_BULLISH_RX.findall(text_lower))
+        bearish_score = len(_BEARISH_RX.findall(text_lower))
         
         if bullish_score > bearish_score:
             return 'bullish'
@@ -440,9 +636,12 @@ class AlternativeDataScraper:
         url = f"https://www.google.com/search?q={search_query}"
         
         try:
+            await self.rate_limit('www.google.com')
             async with self.session.get(url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
+                response.raise_for_status()
+                html = (await response.read()).decode(response.charset or 'utf-8', 'replace')
+                soup = await asyncio.to_thread(BeautifulSoup, html, 'lxml', parse_only=_SEARCH_RESULT_STRAINER)
+                del html
                 
                 events_data = {
                     'company': company,
@@ -491,6 +690,10 @@ async def list_tools() -> List[Tool]:
                     "company": {
                         "type": "string",
                         "description": "Company name to analyze"
+                    },
+                    "force_refresh": {
+                        "type": "boolean",
+                        "description": "Bypass cached results and scrape fresh data"
                     }
                 },
                 "required": ["company"]
@@ -505,6 +708,10 @@ async def list_tools() -> List[Tool]:
                     "domain": {
                         "type": "string",
                         "description": "Domain name (e.g., amazon.com)"
+                    },
+                    "force_refresh": {
+                        "type": "boolean",
+                        "description": "Bypass cached results and scrape fresh data"
                     }
                 },
                 "required": ["domain"]
@@ -519,6 +726,10 @@ async def list_tools() -> List[Tool]:
                     "company": {
                         "type": "string",
                         "description": "Company name"
+                    },
+                    "force_refresh": {
+                        "type": "boolean",
+                        "description": "Bypass cached results and scrape fresh data"
                     }
                 },
                 "required": ["company"]
@@ -533,6 +744,10 @@ async def list_tools() -> List[Tool]:
                     "company": {
                         "type": "string",
                         "description": "Company name"
+                    },
+                    "force_refresh": {
+                        "type": "boolean",
+                        "description": "Bypass cached results and scrape fresh data"
                     }
                 },
                 "required": ["company"]
@@ -569,6 +784,10 @@ async def list_tools() -> List[Tool]:
                     "company": {
                         "type": "string",
                         "description": "Company that owns the app"
+                    },
+                    "force_refresh": {
+                        "type": "boolean",
+                        "description": "Bypass cached results and scrape fresh data"
                     }
                 },
                 "required": ["app_name", "company"]
@@ -591,6 +810,10 @@ async def list_tools() -> List[Tool]:
                     "domain": {
                         "type": "string",
                         "description": "Company domain (optional)"
+                    },
+                    "force_refresh": {
+                        "type": "boolean",
+                        "description": "Bypass cached results and scrape fresh data"
                     }
                 },
                 "required": ["company"]
@@ -600,12 +823,12 @@ async def list_tools() -> List[Tool]:
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> List[TextContent]:
-    await scraper.setup()
+    force_refresh = arguments.get("force_refresh", False)
     
     try:
         if name == "analyze_hiring_trends":
             company = arguments["company"]
-            job_data = await scraper.scrape_indeed_jobs(company)
+            job_data = await scraper.scrape_indeed_jobs(company, force_refresh=force_refresh)
             
             # Add trend analysis
             if not job_data.get('error'):
@@ -621,34 +844,34 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
             
             return [TextContent(
                 type="text",
-                text=json.dumps(job_data, indent=2)
+                text=orjson.dumps(job_data, option=orjson.OPT_INDENT_2).decode()
             )]
         
         elif name == "get_web_traffic_data":
             domain = arguments["domain"]
-            traffic_data = await scraper.scrape_similarweb_traffic(domain)
+            traffic_data = await scraper.scrape_similarweb_traffic(domain, force_refresh=force_refresh)
             
             return [TextContent(
                 type="text",
-                text=json.dumps(traffic_data, indent=2)
+                text=orjson.dumps(traffic_data, option=orjson.OPT_INDENT_2).decode()
             )]
         
         elif name == "track_patent_activity":
             company = arguments["company"]
-            patent_data = await scraper.scrape_patent_activity(company)
+            patent_data = await scraper.scrape_patent_activity(company, force_refresh=force_refresh)
             
             return [TextContent(
                 type="text",
-                text=json.dumps(patent_data, indent=2)
+                text=orjson.dumps(patent_data, option=orjson.OPT_INDENT_2).decode()
             )]
         
         elif name == "analyze_employee_sentiment":
             company = arguments["company"]
-            glassdoor_data = await scraper.scrape_glassdoor_sentiment(company)
+            glassdoor_data = await scraper.scrape_glassdoor_sentiment(company, force_refresh=force_refresh)
             
             return [TextContent(
                 type="text",
-                text=json.dumps(glassdoor_data, indent=2)
+                text=orjson.dumps(glassdoor_data, option=orjson.OPT_INDENT_2).decode()
             )]
         
         elif name == "get_social_sentiment":
@@ -658,17 +881,17 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
             
             return [TextContent(
                 type="text",
-                text=json.dumps(reddit_data, indent=2)
+                text=orjson.dumps(reddit_data, option=orjson.OPT_INDENT_2).decode()
             )]
         
         elif name == "get_app_metrics":
             app_name = arguments["app_name"]
             company = arguments["company"]
-            app_data = await scraper.scrape_app_rankings(app_name, company)
+            app_data = await scraper.scrape_app_rankings(app_name, company, force_refresh=force_refresh)
             
             return [TextContent(
                 type="text",
-                text=json.dumps(app_data, indent=2)
+                text=orjson.dumps(app_data, option=orjson.OPT_INDENT_2).decode()
             )]
         
         elif name == "comprehensive_alternative_data":
@@ -683,66 +906,77 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
                 'analysis_date': datetime.now().isoformat(),
                 'data_points': {}
             }
+            data_points = results['data_points']
+            
+            # Fetch every source concurrently; each targets a different host
+            jobs_task = asyncio.create_task(scraper.scrape_indeed_jobs(company, force_refresh=force_refresh))
+            patents_task = asyncio.create_task(scraper.scrape_patent_activity(company, force_refresh=force_refresh))
+            glassdoor_task = asyncio.create_task(
+                scraper.scrape_glassdoor_sentiment(company, include_reviews=False, force_refresh=force_refresh)
+            )
+            traffic_task = asyncio.create_task(
+                scraper.scrape_similarweb_traffic(domain, force_refresh=force_refresh)
+            ) if domain else None
+            reddit_task = asyncio.create_task(scraper.scrape_reddit_sentiment(company, ticker)) if ticker else None
+            
+            job_data, patent_data, glassdoor_data = await asyncio.gather(jobs_task, patents_task, glassdoor_task)
             
             # Hiring trends
-            job_data = await scraper.scrape_indeed_jobs(company)
             if not job_data.get('error'):
-                results['data_points']['hiring'] = {
+                data_points['hiring'] = {
                     'total_openings': job_data.get('total_jobs', 0),
                     'trend': job_data.get('hiring_trend', 'unknown'),
                     'top_categories': list(job_data.get('job_categories', {}).keys())[:3]
                 }
             
             # Web traffic (if domain provided)
-            if domain:
-                traffic_data = await scraper.scrape_similarweb_traffic(domain)
+            if traffic_task:
+                traffic_data = await traffic_task
                 if not traffic_data.get('error'):
-                    results['data_points']['web_traffic'] = traffic_data.get('metrics', {})
+                    data_points['web_traffic'] = traffic_data.get('metrics', {})
             
             # Patent activity
-            patent_data = await scraper.scrape_patent_activity(company)
             if not patent_data.get('error'):
-                results['data_points']['innovation'] = {
+                data_points['innovation'] = {
                     'recent_patents': len(patent_data.get('recent_patents', [])),
                     'focus_areas': list(patent_data.get('technology_areas', {}).keys())[:3]
                 }
             
             # Employee sentiment
-            glassdoor_data = await scraper.scrape_glassdoor_sentiment(company)
             if not glassdoor_data.get('error'):
-                results['data_points']['employee_sentiment'] = {
+                data_points['employee_sentiment'] = {
                     'rating': glassdoor_data.get('ratings', {}).get('overall', 'N/A'),
                     'sentiment': glassdoor_data.get('employee_sentiment', 'unknown')
                 }
             
             # Social sentiment
-            if ticker:
-                reddit_data = await scraper.scrape_reddit_sentiment(company, ticker)
+            if reddit_task:
+                reddit_data = await reddit_task
                 if not reddit_data.get('error'):
-                    results['data_points']['social_sentiment'] = {
+                    data_points['social_sentiment'] = {
                         'trending': reddit_data.get('trending', False),
                         'mention_count': len(reddit_data.get('mentions', [])),
                         'sentiment_breakdown': reddit_data.get('sentiment_summary', {})
                     }
             
             # Generate insights
-            results['insights'] = []
+            insights = results['insights'] = []
             
-            if results['data_points'].get('hiring', {}).get('trend') == 'aggressive expansion':
-                results['insights'].append('Company showing strong growth signals through aggressive hiring')
+            if data_points.get('hiring', _EMPTY).get('trend') == 'aggressive expansion':
+                insights.append('Company showing strong growth signals through aggressive hiring')
             
-            if results['data_points'].get('employee_sentiment', {}).get('sentiment') == 'positive':
-                results['insights'].append('High employee satisfaction indicates healthy company culture')
+            if data_points.get('employee_sentiment', _EMPTY).get('sentiment') == 'positive':
+                insights.append('High employee satisfaction indicates healthy company culture')
             
-            if results['data_points'].get('innovation', {}).get('recent_patents', 0) > 10:
-                results['insights'].append('Active patent filing suggests strong R&D investment')
+            if data_points.get('innovation', _EMPTY).get('recent_patents', 0) > 10:
+                insights.append('Active patent filing suggests strong R&D investment')
             
-            if results['data_points'].get('social_sentiment', {}).get('trending'):
-                results['insights'].append('High social media activity indicates increased retail investor interest')
+            if data_points.get('social_sentiment', _EMPTY).get('trending'):
+                insights.append('High social media activity indicates increased retail investor interest')
             
             return [TextContent(
                 type="text",
-                text=json.dumps(results, indent=2)
+                text=orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()
             )]
         
         else:
@@ -754,20 +988,27 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
     except Exception as e:
         return [TextContent(
             type="text",
-            text=json.dumps({"error": str(e)}, indent=2)
+            text=orjson.dumps({"error": str(e)}, option=orjson.OPT_INDENT_2).decode()
         )]
 
 async def main():
-    async with stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="alternative-data-scraper",
-                server_version="0.1.0",
-                capabilities={}
+    await scraper.setup()
+    try:
+        async with stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="alternative-data-scraper",
+                    server_version="0.1.0",
+                    capabilities={}
+                )
             )
-        )
+    finally:
+        await scraper.cleanup()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
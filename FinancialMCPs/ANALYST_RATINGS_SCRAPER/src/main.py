@@ -1,21 +1,30 @@
 import time
 #!/usr/bin/env python
 
-import json
 import asyncio
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import re
+import statistics
+from urllib.parse import urlparse
 
 import aiohttp
-from bs4 import BeautifulSoup
+import lxml.html
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.types import Tool, TextContent
 import mcp.server.stdio as stdio
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 import asyncio
-from functools import wraps
+from collections import OrderedDict
+from functools import partial, wraps
 
 # Import advanced modules
 import sys
@@ -23,6 +32,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent / "shared"))
 
 from financial_analysis import ComparativeAnalysis
+from http_client import get_session, close_session
 
 
 def async_retry(max_attempts=3, delay=1):
@@ -44,85 +54,183 @@ def async_retry(max_attempts=3, delay=1):
     return decorator
 
 
+def _class_token_rx(*class_names: str) -> re.Pattern:
+    """Match a class attribute containing any of the given class tokens"""
+    return re.compile(r'(?:^|\s)(?:%s)(?:\s|$)' % '|'.join(map(re.escape, class_names)))
+
+
+def _normalize_ticker(ticker: str) -> str:
+    """Canonical ticker form used for URLs and cache keys"""
+    return ticker.strip().upper()
+
+
+async def gather_sources(*coros) -> List[Any]:
+    """Run independent source scrapes concurrently, turning raised exceptions into error payloads"""
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    return [{'error': str(result)} if isinstance(result, Exception) else result for result in results]
+
+
+async def _stream_html_tree(response: aiohttp.ClientResponse, chunk_size: int = 65536):
+    """Feed the response body to lxml chunk by chunk instead of decoding it into one str first"""
+    parser = lxml.html.HTMLParser(encoding=response.charset) if response.charset else lxml.html.HTMLParser()
+    async for chunk in response.content.iter_chunked(chunk_size):
+        parser.feed(chunk)
+    return parser.close()
+
+
+def _money(text: str) -> Optional[float]:
+    """Last dollar figure in text, so a '$180 → $220' revision yields the new target"""
+    matches = _MONEY_RE.findall(text)
+    return float(matches[-1].replace(',', '')) if matches else None
+
+
+def _target_stats(values) -> Optional[Dict[str, Any]]:
+    """Mean/low/high over parsed price targets, skipping the unparseable ones"""
+    values = [value for value in values if value is not None]
+    if not values:
+        return None
+    return {
+        'mean': round(statistics.fmean(values), 2),
+        'low': min(values),
+        'high': max(values),
+        'count': len(values)
+    }
+
+
+def _cell_texts(row) -> List[str]:
+    """Stripped text of every <td> under an lxml table row"""
+    return [td.text_content().strip() for td in row.iterdescendants('td')]
+
+
+# Caps in-flight page fetches across all tools so fan-outs cannot saturate the connector
+_SCRAPE_SEM = asyncio.Semaphore(16)
+
+# Only the tables/sections each scraper reads get materialized
+_FINVIZ_STRAINER = SoupStrainer('table', class_=_class_token_rx('ratings-outer', 'snapshot-table'))
+_MARKETWATCH_STRAINER = SoupStrainer(['div', 'table'], class_=_class_token_rx('analyst-consensus', 'ratings-distribution'))
+_BENZINGA_ITEM_RE = re.compile(r'analyst-rating-item')
+_BENZINGA_STRAINER = SoupStrainer('div', class_=_BENZINGA_ITEM_RE)
+
+_MONEY_RE = re.compile(r'\d[\d,]*(?:\.\d+)?')
+
+# Lowercased rating phrases in match order ('strong buy'/'strong sell' must be tried before 'buy'/'sell')
+_RATING_SCORES = tuple((key.lower(), value) for key, value in {
+    'Strong Buy': 5, 'Strong Sell': 1, 'Buy': 4, 'Hold': 3, 'Sell': 2,
+    'Outperform': 4, 'Market Perform': 3, 'Underperform': 2,
+    'Overweight': 4, 'Equal Weight': 3, 'Underweight': 2
+}.items())
+
+
 
 class AnalystRatingsScraper:
     """Scraper for analyst ratings and price targets from free sources"""
     
     def __init__(self):
-        self.session: Optional[aiohttp.ClientSession] = None
-        self.last_request_time = {}
+        self._domain_locks: Dict[str, asyncio.Lock] = {}
+        self._domain_last: Dict[str, float] = {}
+        
+        # Per-(source, ticker) results, LRU-bounded; ratings do not move at sub-minute cadence
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._cache_ttl = 300.0
+        self._cache_maxsize = 1024
 
         # Initialize advanced components
         self.analysis_enhanced = True
         self.min_delay = 1.0  # Rate limiting
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': 'gzip, deflate'
         }
 
     async def rate_limit(self, url: str):
-        """Implement rate limiting per domain"""
-        from urllib.parse import urlparse
+        """Implement rate limiting per domain; concurrent requests to one host are spaced min_delay apart"""
         domain = urlparse(url).netloc
+        lock = self._domain_locks.setdefault(domain, asyncio.Lock())
         
-        if domain in self.last_request_time:
-            elapsed = time.time() - self.last_request_time[domain]
-            if elapsed < self.min_delay:
-                await asyncio.sleep(self.min_delay - elapsed)
-        
-        self.last_request_time[domain] = time.time()
+        async with lock:
+            if domain in self._domain_last:
+                elapsed = time.monotonic() - self._domain_last[domain]
+                if elapsed < self.min_delay:
+                    await asyncio.sleep(self.min_delay - elapsed)
+            
+            self._domain_last[domain] = time.monotonic()
             
+    async def _cached(self, key: Tuple[str, str], coro_factory) -> Any:
+        """Serve a fresh cached result, or join the single in-flight fetch for key"""
+        entry = self._cache.get(key)
+        if entry:
+            if time.monotonic() - entry[0] < self._cache_ttl:
+                self._cache.move_to_end(key)
+                return entry[1]
+            del self._cache[key]
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fill(key, coro_factory))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shielded so one cancelled caller does not abort the fetch for the others
+        return await asyncio.shield(task)
+    
+    async def _fill(self, key: Tuple[str, str], coro_factory) -> Any:
+        """Run coro_factory and cache its result unless it is an error payload"""
+        result = await coro_factory()
+        failed = result.get('error') if isinstance(result, dict) else any('error' in item for item in result)
+        if not failed:
+            self._cache[key] = (time.monotonic(), result)
+            self._cache.move_to_end(key)
+            # Batch fan-outs touch many tickers; the least recently used ones go first
+            while len(self._cache) > self._cache_maxsize:
+                self._cache.popitem(last=False)
+        return result
+    
     async def setup(self):
-        """Setup aiohttp session"""
-        if not self.session or self.session.closed:
-            self.session = aiohttp.ClientSession(headers=self.headers)
+        """Setup the shared aiohttp session"""
+        await get_session()
     
     async def cleanup(self):
-        """Cleanup aiohttp session"""
-        if self.session:
-            await self.session.close()
+        """Close the shared aiohttp session on server shutdown"""
+        await close_session()
     
     async def scrape_finviz_ratings(self, ticker: str) -> Dict[str, Any]:
         """Scrape analyst ratings from Finviz"""
+        return await self._cached(('finviz', ticker), partial(self._scrape_finviz_ratings, ticker))
+    
+    async def _scrape_finviz_ratings(self, ticker: str) -> Dict[str, Any]:
+        """Fetch and parse Finviz ratings, bypassing the cache"""
         url = f"https://finviz.com/quote.ashx?t={ticker}"
         
         try:
-            async with self.session.get(url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
+            await self.rate_limit(url)
+            session = await get_session()
+            async with _SCRAPE_SEM, session.get(url, headers=self.headers) as response:
+                soup = BeautifulSoup(await response.read(), 'lxml', from_encoding=response.charset, parse_only=_FINVIZ_STRAINER)
+                
+                # Find the ratings table
+                rows = (row.find_all('td') for table in soup.find_all('table', {'class': 'ratings-outer'}) for row in table.find_all('tr'))
                 
                 ratings_data = {
                     'ticker': ticker,
                     'source': 'finviz',
-                    'ratings': {},
+                    'ratings': [
+                        {
+                            'date': cells[0].text.strip(),
+                            'action': cells[1].text.strip(),
+                            'analyst': cells[2].text.strip(),
+                            'rating': cells[3].text.strip(),
+                            'price_target': target,
+                            'price_target_value': _money(target)
+                        }
+                        for cells in rows if len(cells) >= 5
+                        for target in (cells[4].text.strip(),)
+                    ],
                     'price_targets': {}
                 }
                 
-                # Find the ratings table
-                tables = soup.find_all('table', {'class': 'ratings-outer'})
-                
-                for table in tables:
-                    rows = table.find_all('tr')
-                    for row in rows:
-                        cells = row.find_all('td')
-                        if len(cells) >= 5:
-                            # Parse rating data
-                            date = cells[0].text.strip()
-                            action = cells[1].text.strip()
-                            analyst = cells[2].text.strip()
-                            rating = cells[3].text.strip()
-                            price_target = cells[4].text.strip()
-                            
-                            if 'ratings' not in ratings_data:
-                                ratings_data['ratings'] = []
-                            
-                            ratings_data['ratings'].append({
-                                'date': date,
-                                'action': action,
-                                'analyst': analyst,
-                                'rating': rating,
-                                'price_target': price_target
-                            })
-                
                 # Get consensus data from the main table
                 snapshot_table = soup.find('table', {'class': 'snapshot-table'})
                 if snapshot_table:
@@ -135,6 +243,7 @@ class AnalystRatingsScraper:
                                 
                                 if 'Target Price' in label:
                                     ratings_data['consensus_target'] = value
+                                    ratings_data['consensus_target_value'] = _money(value)
                                 elif 'Recom' in label:
                                     ratings_data['consensus_rating'] = value
                 
@@ -145,12 +254,17 @@ class AnalystRatingsScraper:
     
     async def scrape_marketwatch_ratings(self, ticker: str) -> Dict[str, Any]:
         """Scrape analyst ratings from MarketWatch"""
+        return await self._cached(('marketwatch', ticker), partial(self._scrape_marketwatch_ratings, ticker))
+    
+    async def _scrape_marketwatch_ratings(self, ticker: str) -> Dict[str, Any]:
+        """Fetch and parse MarketWatch ratings, bypassing the cache"""
         url = f"https://www.marketwatch.com/investing/stock/{ticker}/analystestimates"
         
         try:
-            async with self.session.get(url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
+            await self.rate_limit(url)
+            session = await get_session()
+            async with _SCRAPE_SEM, session.get(url, headers=self.headers) as response:
+                soup = BeautifulSoup(await response.read(), 'lxml', from_encoding=response.charset, parse_only=_MARKETWATCH_STRAINER)
                 
                 ratings_data = {
                     'ticker': ticker,
@@ -183,12 +297,17 @@ class AnalystRatingsScraper:
     
     async def scrape_yahoo_analyst_info(self, ticker: str) -> Dict[str, Any]:
         """Scrape analyst information from Yahoo Finance"""
+        return await self._cached(('yahoo', ticker), partial(self._scrape_yahoo_analyst_info, ticker))
+    
+    async def _scrape_yahoo_analyst_info(self, ticker: str) -> Dict[str, Any]:
+        """Fetch and parse Yahoo Finance analyst info, bypassing the cache"""
         url = f"https://finance.yahoo.com/quote/{ticker}/analysis"
         
         try:
-            async with self.session.get(url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
+            await self.rate_limit(url)
+            session = await get_session()
+            async with _SCRAPE_SEM, session.get(url, headers=self.headers) as response:
+                tree = await _stream_html_tree(response)
                 
                 analyst_data = {
                     'ticker': ticker,
@@ -198,39 +317,35 @@ class AnalystRatingsScraper:
                     'recommendation_trends': []
                 }
                 
-                # Extract tables with analyst data
-                tables = soup.find_all('table')
+                # Only the analyst section's tables are candidates; fall back to the whole page if Yahoo drops the wrapper
+                tables = tree.xpath('//section[@data-test="qsp-analyst"]//table') or tree.xpath('//table')
                 
                 for table in tables:
                     # Check table headers to identify content
-                    headers = [th.text.strip() for th in table.find_all('th')]
+                    headers = [th.text_content().strip() for th in table.iterdescendants('th')]
                     
                     if 'Low' in headers and 'High' in headers and 'Average' in headers:
                         # Price target table
-                        rows = table.find_all('tr')[1:]  # Skip header
-                        for row in rows:
-                            cells = row.find_all('td')
+                        for row in table.xpath('.//tr')[1:]:  # Skip header
+                            cells = _cell_texts(row)
                             if cells:
-                                period = cells[0].text.strip()
-                                analyst_data['price_targets'][period] = {
-                                    'low': cells[1].text.strip() if len(cells) > 1 else '',
-                                    'high': cells[2].text.strip() if len(cells) > 2 else '',
-                                    'average': cells[3].text.strip() if len(cells) > 3 else '',
-                                    'current': cells[4].text.strip() if len(cells) > 4 else ''
+                                analyst_data['price_targets'][cells[0]] = {
+                                    'low': cells[1] if len(cells) > 1 else '',
+                                    'high': cells[2] if len(cells) > 2 else '',
+                                    'average': cells[3] if len(cells) > 3 else '',
+                                    'current': cells[4] if len(cells) > 4 else ''
                                 }
                     
                     elif 'No. of Analysts' in headers:
                         # Earnings estimates table
-                        rows = table.find_all('tr')[1:]
-                        for row in rows:
-                            cells = row.find_all('td')
-                            if cells and len(cells) > 1:
-                                metric = cells[0].text.strip()
-                                analyst_data['earnings_estimates'][metric] = {
-                                    'current_qtr': cells[1].text.strip() if len(cells) > 1 else '',
-                                    'next_qtr': cells[2].text.strip() if len(cells) > 2 else '',
-                                    'current_year': cells[3].text.strip() if len(cells) > 3 else '',
-                                    'next_year': cells[4].text.strip() if len(cells) > 4 else ''
+                        for row in table.xpath('.//tr')[1:]:
+                            cells = _cell_texts(row)
+                            if len(cells) > 1:
+                                analyst_data['earnings_estimates'][cells[0]] = {
+                                    'current_qtr': cells[1],
+                                    'next_qtr': cells[2] if len(cells) > 2 else '',
+                                    'current_year': cells[3] if len(cells) > 3 else '',
+                                    'next_year': cells[4] if len(cells) > 4 else ''
                                 }
                 
                 return analyst_data
@@ -240,17 +355,22 @@ class AnalystRatingsScraper:
     
     async def scrape_benzinga_ratings(self, ticker: str) -> List[Dict[str, Any]]:
         """Scrape recent analyst actions from Benzinga"""
+        return await self._cached(('benzinga', ticker), partial(self._scrape_benzinga_ratings, ticker))
+    
+    async def _scrape_benzinga_ratings(self, ticker: str) -> List[Dict[str, Any]]:
+        """Fetch and parse Benzinga analyst actions, bypassing the cache"""
         url = f"https://www.benzinga.com/quote/{ticker}/analyst-ratings"
         
         try:
-            async with self.session.get(url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
+            await self.rate_limit(url)
+            session = await get_session()
+            async with _SCRAPE_SEM, session.get(url, headers=self.headers) as response:
+                soup = BeautifulSoup(await response.read(), 'lxml', from_encoding=response.charset, parse_only=_BENZINGA_STRAINER)
                 
                 ratings = []
                 
                 # Look for analyst ratings in the content
-                rating_items = soup.find_all('div', {'class': re.compile('analyst-rating-item')})
+                rating_items = soup.find_all('div', {'class': _BENZINGA_ITEM_RE})
                 
                 for item in rating_items[:20]:  # Get recent 20 ratings
                     date_elem = item.find('span', {'class': 'date'})
@@ -269,6 +389,7 @@ class AnalystRatingsScraper:
                     }
                     
                     if any(rating_data.values()):
+                        rating_data['price_target_value'] = _money(rating_data['price_target'])
                         ratings.append(rating_data)
                 
                 return ratings
@@ -280,10 +401,17 @@ class AnalystRatingsScraper:
     
     async def calculate_consensus(self, ticker: str) -> Dict[str, Any]:
         """Calculate consensus rating from multiple sources"""
+        consensus, _ = await self.calculate_consensus_with_finviz(ticker)
+        return consensus
+    
+    async def calculate_consensus_with_finviz(self, ticker: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Calculate consensus and also return the Finviz payload it was built from"""
         # Gather data from all sources
-        finviz_data = await self.scrape_finviz_ratings(ticker)
-        yahoo_data = await self.scrape_yahoo_analyst_info(ticker)
-        marketwatch_data = await self.scrape_marketwatch_ratings(ticker)
+        finviz_data, yahoo_data, marketwatch_data = await gather_sources(
+            self.scrape_finviz_ratings(ticker),
+            self.scrape_yahoo_analyst_info(ticker),
+            self.scrape_marketwatch_ratings(ticker)
+        )
         
         consensus = {
             'ticker': ticker,
@@ -313,17 +441,11 @@ class AnalystRatingsScraper:
             }
         
         # Calculate overall consensus
-        rating_map = {
-            'Strong Buy': 5, 'Buy': 4, 'Hold': 3, 'Sell': 2, 'Strong Sell': 1,
-            'Outperform': 4, 'Market Perform': 3, 'Underperform': 2,
-            'Overweight': 4, 'Equal Weight': 3, 'Underweight': 2
-        }
-        
         ratings = []
         if finviz_data.get('consensus_rating'):
-            rating_text = finviz_data['consensus_rating'].split('(')[0].strip()
-            for key, value in rating_map.items():
-                if key.lower() in rating_text.lower():
+            rating_text = finviz_data['consensus_rating'].split('(')[0].strip().lower()
+            for key, value in _RATING_SCORES:
+                if key in rating_text:
                     ratings.append(value)
                     break
         
@@ -337,13 +459,20 @@ class AnalystRatingsScraper:
                 consensus['overall_consensus']['rating'] = 'Sell'
             consensus['overall_consensus']['score'] = avg_rating
         
-        return consensus
+        target_stats = _target_stats(rating.get('price_target_value') for rating in finviz_data.get('ratings', []))
+        if target_stats:
+            consensus['overall_consensus']['price_target'] = target_stats
+        
+        return consensus, finviz_data
 
 
 # Initialize server
 server = Server("analyst-ratings-scraper")
 scraper = AnalystRatingsScraper()
 
+# Tickers scraped at once by get_analyst_ratings_batch
+BATCH_CONCURRENCY = 8
+
 # Define tools
 @server.list_tools()
 async def list_tools() -> List[Tool]:
@@ -428,39 +557,55 @@ async def list_tools() -> List[Tool]:
                 },
                 "required": ["tickers"]
             }
+        ),
+        Tool(
+            name="get_analyst_ratings_batch",
+            description="Get consensus analyst ratings for many stocks in one call",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "tickers": {
+                        "type": "array",
+                        "description": "List of stock ticker symbols",
+                        "items": {"type": "string"}
+                    }
+                },
+                "required": ["tickers"]
+            }
         )
     ]
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> List[TextContent]:
-    await scraper.setup()
-    
     try:
         if name == "get_analyst_ratings":
-            ticker = arguments["ticker"].upper()
+            ticker = _normalize_ticker(arguments["ticker"])
             source = arguments.get("source", "all").lower()
             
-            results = {}
-            if source == "all" or source == "finviz":
-                results["finviz"] = await scraper.scrape_finviz_ratings(ticker)
-            if source == "all" or source == "marketwatch":
-                results["marketwatch"] = await scraper.scrape_marketwatch_ratings(ticker)
-            if source == "all" or source == "yahoo":
-                results["yahoo"] = await scraper.scrape_yahoo_analyst_info(ticker)
-            if source == "all" or source == "benzinga":
-                results["benzinga"] = await scraper.scrape_benzinga_ratings(ticker)
+            scrapers = {
+                "finviz": scraper.scrape_finviz_ratings,
+                "marketwatch": scraper.scrape_marketwatch_ratings,
+                "yahoo": scraper.scrape_yahoo_analyst_info,
+                "benzinga": scraper.scrape_benzinga_ratings
+            }
+            selected = [key for key in scrapers if source == "all" or source == key]
+            
+            source_data = await gather_sources(*(scrapers[key](ticker) for key in selected))
+            results = dict(zip(selected, source_data))
             
             return [TextContent(
                 type="text",
-                text=json.dumps(results, indent=2)
+                text=orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()
             )]
         
         elif name == "get_price_targets":
-            ticker = arguments["ticker"].upper()
+            ticker = _normalize_ticker(arguments["ticker"])
             
             # Get price targets from multiple sources
-            finviz_data = await scraper.scrape_finviz_ratings(ticker)
-            yahoo_data = await scraper.scrape_yahoo_analyst_info(ticker)
+            finviz_data, yahoo_data = await gather_sources(
+                scraper.scrape_finviz_ratings(ticker),
+                scraper.scrape_yahoo_analyst_info(ticker)
+            )
             
             price_targets = {
                 'ticker': ticker,
@@ -477,30 +622,37 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
                             'date': rating['date'],
                             'analyst': rating['analyst'],
                             'target': rating['price_target'],
+                            'target_value': rating.get('price_target_value'),
                             'action': rating['action']
                         })
             
+            target_stats = _target_stats(change['target_value'] for change in price_targets['recent_changes'])
+            if target_stats:
+                price_targets['recent_target_stats'] = target_stats
+            
             return [TextContent(
                 type="text",
-                text=json.dumps(price_targets, indent=2)
+                text=orjson.dumps(price_targets, option=orjson.OPT_INDENT_2).decode()
             )]
         
         elif name == "get_consensus_rating":
-            ticker = arguments["ticker"].upper()
+            ticker = _normalize_ticker(arguments["ticker"])
             consensus = await scraper.calculate_consensus(ticker)
             
             return [TextContent(
                 type="text",
-                text=json.dumps(consensus, indent=2)
+                text=orjson.dumps(consensus, option=orjson.OPT_INDENT_2).decode()
             )]
         
         elif name == "get_rating_changes":
-            ticker = arguments["ticker"].upper()
+            ticker = _normalize_ticker(arguments["ticker"])
             days = arguments.get("days", 30)
             
             # Get recent ratings from Finviz
-            finviz_data = await scraper.scrape_finviz_ratings(ticker)
-            benzinga_data = await scraper.scrape_benzinga_ratings(ticker)
+            finviz_data, benzinga_data = await gather_sources(
+                scraper.scrape_finviz_ratings(ticker),
+                scraper.scrape_benzinga_ratings(ticker)
+            )
             
             changes = {
                 'ticker': ticker,
@@ -534,11 +686,11 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
             
             return [TextContent(
                 type="text",
-                text=json.dumps(changes, indent=2)
+                text=orjson.dumps(changes, option=orjson.OPT_INDENT_2).decode()
             )]
         
         elif name == "compare_analyst_coverage":
-            tickers = [t.upper() for t in arguments["tickers"]]
+            tickers = [_normalize_ticker(t) for t in arguments["tickers"]]
             
             comparison = {
                 'tickers': tickers,
@@ -546,21 +698,43 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
                 'timestamp': datetime.now().isoformat()
             }
             
-            for ticker in tickers[:5]:  # Limit to 5 to avoid rate limiting
-                consensus = await scraper.calculate_consensus(ticker)
-                finviz_data = await scraper.scrape_finviz_ratings(ticker)
+            async def cover(ticker: str) -> Tuple[str, Dict[str, Any]]:
+                # Reuse the Finviz payload behind the consensus instead of fetching it twice
+                consensus, finviz_data = await scraper.calculate_consensus_with_finviz(ticker)
+                overall = consensus.get('overall_consensus', {})
                 
-                comparison['coverage'][ticker] = {
-                    'consensus_rating': consensus.get('overall_consensus', {}).get('rating', 'N/A'),
-                    'consensus_score': consensus.get('overall_consensus', {}).get('score', 0),
+                return ticker, {
+                    'consensus_rating': overall.get('rating', 'N/A'),
+                    'consensus_score': overall.get('score', 0),
                     'price_target': finviz_data.get('consensus_target', 'N/A'),
                     'recent_actions': len(finviz_data.get('ratings', [])),
                     'sources': list(consensus.get('sources', {}).keys())
                 }
             
+            # Limit to 5 to avoid rate limiting; the tickers are covered concurrently
+            coverage = await asyncio.gather(*(cover(ticker) for ticker in tickers[:5]))
+            comparison['coverage'] = dict(coverage)
+            
             return [TextContent(
                 type="text",
-                text=json.dumps(comparison, indent=2)
+                text=orjson.dumps(comparison, option=orjson.OPT_INDENT_2).decode()
+            )]
+        
+        elif name == "get_analyst_ratings_batch":
+            tickers = list(dict.fromkeys(_normalize_ticker(t) for t in arguments["tickers"]))
+            
+            # Bound the fan-out so a long ticker list cannot monopolize the connection pool
+            semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+            
+            async def bounded(ticker: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await scraper.calculate_consensus(ticker)
+            
+            consensus = await gather_sources(*(bounded(ticker) for ticker in tickers))
+            
+            return [TextContent(
+                type="text",
+                text=orjson.dumps(dict(zip(tickers, consensus)), option=orjson.OPT_INDENT_2).decode()
             )]
         
         else:
@@ -572,20 +746,28 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
     except Exception as e:
         return [TextContent(
             type="text",
-            text=json.dumps({"error": str(e)}, indent=2)
+            text=orjson.dumps({"error": str(e)}, option=orjson.OPT_INDENT_2).decode()
         )]
 
 async def main():
-    async with stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="analyst-ratings-scraper",
-                server_version="0.1.0",
-                capabilities={}
+    # The session lives for the whole server run instead of being checked per tool call
+    await scraper.setup()
+    try:
+        async with stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="analyst-ratings-scraper",
+                    server_version="0.1.0",
+                    capabilities={}
+                )
             )
-        )
+    finally:
+        await scraper.cleanup()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
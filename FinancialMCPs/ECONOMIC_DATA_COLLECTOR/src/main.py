@@ -1,364 +1,777 @@
 import time
 #!/usr/bin/env python
 
-import json
 import asyncio
+import csv
+import random
+import io
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import re
-from urllib.parse import quote
+from urllib.parse import quote, urlparse
 
 import aiohttp
-from bs4 import BeautifulSoup
+import orjson
+import lxml.html
+from lxml import etree
+from bs4 import BeautifulSoup, SoupStrainer
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.types import Tool, TextContent
 import mcp.server.stdio as stdio
 
 import asyncio
-from functools import wraps
+from collections import OrderedDict
+from functools import lru_cache, partial, reduce, wraps
 
 # Import advanced modules
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent / "shared"))
 
+from data_cache import FinancialDataCache
+
+# Seconds a fetched page is served from disk before it is revalidated with the origin
+SERIES_TTL = 3600            # FRED series and Treasury yields move daily
+RELEASE_TTL = 6 * 3600       # BLS/BEA/Census release pages change monthly at most
+CALENDAR_TTL = 24 * 3600     # FOMC calendar
+# Stale pages are kept this long so their ETag/Last-Modified can still be revalidated
+STALE_RETENTION = timedelta(days=7)
+
+disk_cache = FinancialDataCache()
+
+# Days of history requested for the dashboard's batched FRED indicators
+FRED_BATCH_LOOKBACK_DAYS = 370
+
+# Days of history requested for a single FRED series: enough for ten annual observations
+FRED_SERIES_LOOKBACK_DAYS = 11 * 366
+
+# Metadata of the series the dashboard tracks, so their pages never need scraping
+_FRED_STATIC = {
+    'GDP': {'title': 'Gross Domestic Product', 'units': 'Billions of Dollars', 'frequency': 'Quarterly'},
+    'UNRATE': {'title': 'Unemployment Rate', 'units': 'Percent', 'frequency': 'Monthly'},
+    'CPIAUCSL': {
+        'title': 'Consumer Price Index for All Urban Consumers: All Items in U.S. City Average',
+        'units': 'Index 1982-1984=100',
+        'frequency': 'Monthly'
+    },
+    'DFF': {'title': 'Federal Funds Effective Rate', 'units': 'Percent', 'frequency': 'Daily, 7-Day'},
+    'DGS10': {
+        'title': 'Market Yield on U.S. Treasury Securities at 10-Year Constant Maturity, Quoted on an Investment Basis',
+        'units': 'Percent',
+        'frequency': 'Daily'
+    },
+    'VIXCLS': {'title': 'CBOE Volatility Index: VIX', 'units': 'Index', 'frequency': 'Daily, Close'},
+    'DTWEXBGS': {'title': 'Nominal Broad U.S. Dollar Index', 'units': 'Index Jan 2006=100', 'frequency': 'Daily'},
+    'DCOILWTICO': {
+        'title': 'Crude Oil Prices: West Texas Intermediate (WTI) - Cushing, Oklahoma',
+        'units': 'Dollars per Barrel',
+        'frequency': 'Daily'
+    }
+}
+
+# BLS news releases keep the release prose in this container
+BLS_RELEASE_XPATH = "//div[@id='bodytext']"
+
+# Release-text patterns, compiled once at import
+_UNEMPLOYMENT_RE = re.compile(r'unemployment rate.*?(\d+\.\d+)\s*percent', re.I)
+_PAYROLLS_RE = re.compile(r'nonfarm payroll employment.*?(\d+,?\d*)\s*(?:thousand|,000)', re.I)
+_WAGE_RE = re.compile(r'average hourly earnings.*?(\d+\.\d+)\s*percent', re.I)
+_HEADLINE_CPI_RE = re.compile(r'Consumer Price Index.*?(\d+\.\d+)\s*percent.*?12 months', re.I)
+_CORE_CPI_RE = re.compile(r'excluding food and energy.*?(\d+\.\d+)\s*percent.*?12 months', re.I)
+_CPI_CATEGORIES = ('food', 'energy', 'shelter', 'medical', 'transportation')
+_CPI_CATEGORY_RE = re.compile('|'.join(_CPI_CATEGORIES), re.I)
+_PERCENT_TAIL_RE = re.compile(r'.*?(\d+\.\d+)\s*percent', re.I)
+_GDP_LINK_RE = re.compile('Gross Domestic Product', re.I)
+_REAL_GDP_RE = re.compile(r'real.*?GDP.*?(\d+\.\d+)\s*percent.*?annual rate', re.I)
+_GDP_COMPONENT_RES = {
+    key: re.compile(rf'{pattern}.*?(\d+\.\d+)\s*percent', re.I)
+    for key, pattern in {
+        'consumption': 'personal consumption',
+        'investment': 'gross private.*?investment',
+        'government': 'government.*?expenditures',
+        'net_exports': 'net exports'
+    }.items()
+}
+_FED_RATE_RANGE_RE = re.compile(r'(\d+\.?\d*)\s*to\s*(\d+\.?\d*)\s*percent')
+_MORTGAGE_RATE_RE = re.compile(r'(\d+\.\d+)%')
+_HOUSING_STARTS_RE = re.compile(r'housing starts.*?(\d+,?\d*)\s*thousand', re.I)
+_RETAIL_SALES_RE = re.compile(r'retail.*?sales.*?(\d+\.\d+)\s*percent', re.I)
+
+# Dashboard outlook rules: (path into the dashboard, parser, classifier -> (field, label, risk) or None).
+# Rules run in order, so key_risks keep a stable ordering.
+_OUTLOOK_RULES = (
+    (('yield_curve', 'spreads', 'inverted'), bool,
+     lambda inverted: ('growth_outlook', 'weakening', 'Inverted yield curve signals recession risk') if inverted else None),
+    (('labor_market', 'unemployment_rate', 'current'), float,
+     lambda rate: ('labor_market_strength', 'very strong', None) if rate < 4.0
+     else ('labor_market_strength', 'weakening', None) if rate > 5.0 else None),
+    (('inflation', 'core_cpi', 'year_over_year'), float,
+     lambda core: ('inflation_pressure', 'elevated', 'Persistent inflation may require tighter policy') if core > 3.0
+     else ('inflation_pressure', 'low', None) if core < 2.0 else None),
+    (('policy', 'current_rate', 'midpoint'), float,
+     lambda rate: ('policy_stance', 'restrictive', None) if rate > 5.0
+     else ('policy_stance', 'accommodative', None) if rate < 2.0 else None),
+)
+
+# Network failures worth another attempt; parse errors and the like are not
+TRANSIENT_ERRORS = (aiohttp.ClientConnectionError, aiohttp.ServerTimeoutError, asyncio.TimeoutError)
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Network failures plus throttling (429) and server-side (5xx) responses are worth another attempt"""
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status == 429 or exc.status >= 500
+    return isinstance(exc, TRANSIENT_ERRORS)
 
 
 def async_retry(max_attempts=3, delay=1):
-    """Retry decorator for async functions"""
+    """Retry decorator for async functions; only transient failures are retried, with jittered exponential backoff"""
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            last_exception = None
             for attempt in range(max_attempts):
                 try:
                     return await func(*args, **kwargs)
                 except Exception as e:
-                    last_exception = e
-                    if attempt < max_attempts - 1:
-                        await asyncio.sleep(delay * (attempt + 1))
-                    continue
-            raise last_exception
+                    if not _is_transient(e) or attempt == max_attempts - 1:
+                        raise
+                    await asyncio.sleep(delay * 2 ** attempt + random.uniform(0, 0.3))
+        return wrapper
+    return decorator
+
+
+def async_ttl_cache(ttl: float, maxsize: int = 128):
+    """TTL/LRU cache for parsed collector results; concurrent callers with the same arguments share one in-flight task"""
+    def decorator(func):
+        cache = OrderedDict()
+        
+        def evict_failed(key, task):
+            # Error payloads are retried on the next call rather than served for a whole TTL
+            failed = task.cancelled() or task.exception() is not None
+            if not failed:
+                result = task.result()
+                failed = isinstance(result, dict) and 'error' in result
+            if failed and key in cache and cache[key][1] is task:
+                del cache[key]
+        
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            entry = cache.get(key)
+            
+            if entry and entry[0] > now:
+                cache.move_to_end(key)
+                task = entry[1]
+            else:
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                task.add_done_callback(partial(evict_failed, key))
+                cache[key] = (now + ttl, task)
+                cache.move_to_end(key)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            
+            return await asyncio.shield(task)
+        
+        wrapper.cache_clear = cache.clear
         return wrapper
     return decorator
 
 
+def _class_token_rx(*class_names: str) -> re.Pattern:
+    """Match a class attribute containing any of the given class tokens"""
+    return re.compile(r'(?:^|\s)(?:%s)(?:\s|$)' % '|'.join(map(re.escape, class_names)))
+
+
+# Only the nodes a bs4-based scraper reads get built into its tree
+_FRED_META_STRAINER = SoupStrainer(['h1', 'div'], class_=_class_token_rx('series-title', 'series-meta-item'))
+_LINK_STRAINER = SoupStrainer('a')
+
+
+@lru_cache(maxsize=256)
+def _domain_of(url: str) -> str:
+    """Host of an endpoint URL; the collector only talks to a fixed set, so each is parsed once"""
+    return urlparse(url).netloc
+
+
+_cached_timestamp = (0.0, '')
+
+
+def _now_iso() -> str:
+    """ISO timestamp for payloads, reused for half a second so one dashboard shares a single value"""
+    global _cached_timestamp
+    now = time.time()
+    if now - _cached_timestamp[0] > 0.5:
+        _cached_timestamp = (now, datetime.fromtimestamp(now).isoformat())
+    return _cached_timestamp[1]
+
+
+def _dump(obj: Any) -> str:
+    """Compact JSON for tool responses; MCP clients parse it, so pretty-printing is wasted work"""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+async def gather_sources(*coros) -> List[Any]:
+    """Run independent source scrapes concurrently, turning raised exceptions into error payloads"""
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    return [{'error': str(result)} if isinstance(result, Exception) else result for result in results]
+
+
+def _scan_cpi_categories(text: str) -> Dict[str, str]:
+    """First '<category> ... N.N percent' figure per CPI category, from one pass over the text.
+    
+    Equivalent to searching each category's pattern separately: occurrences are tried in order
+    and the first one followed by a percentage on the same line wins.
+    """
+    found = {}
+    for keyword in _CPI_CATEGORY_RE.finditer(text):
+        category = keyword.group().lower()
+        if category in found:
+            continue
+        tail = _PERCENT_TAIL_RE.match(text, keyword.end())
+        if tail:
+            found[category] = tail.group(1)
+            if len(found) == len(_CPI_CATEGORIES):
+                break
+    return {category: found[category] for category in _CPI_CATEGORIES if category in found}
+
+
+def _fred_csv_header(rows, series_ids: Tuple[str, ...]) -> List[str]:
+    """Consume and check the fredgraph.csv header (date column, then one column per series id).
+    
+    An error page or an unknown series comes back as HTML, which must not be read as an empty series.
+    """
+    header = next(rows, None)
+    if not header or header[0].lstrip('\ufeff').strip().upper() not in ('DATE', 'OBSERVATION_DATE'):
+        raise ValueError("FRED did not return a CSV export")
+    # A batch may legitimately lack a discontinued series, but a CSV with none of the requested ones is wrong
+    columns = {column.strip().upper() for column in header[1:]}
+    if not columns & {series_id.upper() for series_id in series_ids}:
+        raise ValueError(f"FRED CSV has no column for {', '.join(series_ids)}")
+    return header
+
+
+def _fred_csv_observations(csv_text: str, series_id: str) -> List[Dict[str, str]]:
+    """Observations from a fredgraph.csv export, most recent first; FRED marks missing values with '.'"""
+    rows = csv.reader(io.StringIO(csv_text))
+    _fred_csv_header(rows, (series_id,))
+    observations = [{'date': row[0], 'value': row[1]} for row in rows if len(row) >= 2 and row[1] != '.']
+    observations.reverse()
+    return observations
+
+
+def _fred_csv_columns(csv_text: str, series_ids: Tuple[str, ...]) -> Dict[str, List[Dict[str, str]]]:
+    """Per-series observations from a multi-series fredgraph.csv export, most recent first.
+    
+    Series are outer-joined on date, so each column skips the rows where it has no value.
+    """
+    rows = csv.reader(io.StringIO(csv_text))
+    header = _fred_csv_header(rows, series_ids)
+    series_ids = header[1:]
+    columns = {series_id: [] for series_id in series_ids}
+    for row in rows:
+        for series_id, value in zip(series_ids, row[1:]):
+            if value and value != '.':
+                columns[series_id].append({'date': row[0], 'value': value})
+    for observations in columns.values():
+        observations.reverse()
+    return columns
+
+
+def _parse(html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse a page with the C-backed lxml tree builder; the one place to swap parsers"""
+    return BeautifulSoup(html, 'lxml', parse_only=parse_only)
+
+
+def _page_text(html: str, content_xpath: Optional[str] = None) -> str:
+    """Visible text of a page for regex extraction, without building a BeautifulSoup tree.
+    
+    Page chrome is dropped first; with content_xpath only the matching nodes are read, falling
+    back to the whole page if the site layout no longer matches.
+    """
+    if not html.strip():
+        return ''
+    tree = lxml.html.fromstring(html)
+    etree.strip_elements(tree, 'script', 'style', 'nav', 'header', 'footer', with_tail=False)
+    nodes = tree.xpath(content_xpath) if content_xpath else []
+    if nodes:
+        return ' '.join(node.text_content() for node in nodes)
+    return tree.text_content()
+
+
+def _search_page_text(html: str, pattern: re.Pattern) -> Optional[re.Match]:
+    """First match of pattern in a page's visible text"""
+    return pattern.search(_page_text(html))
+
+
+def _html_tree(html: str):
+    """lxml.html tree of a page; an empty body parses to a bare <html> element instead of raising"""
+    return lxml.html.fromstring(html) if html.strip() else lxml.html.Element('html')
+
+
+_XPATH_LOWERCASE = "translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+
+def _text_parent(tree, phrase: str):
+    """Element directly holding the first text node that contains phrase (case-insensitive), or None.
+    
+    The text scan runs as XPath in C; a tail text belongs to the enclosing element, not its sibling.
+    """
+    matches = tree.xpath(f"//text()[contains({_XPATH_LOWERCASE}, $phrase)]", phrase=phrase.lower())
+    if not matches:
+        return None
+    parent = matches[0].getparent()
+    return parent.getparent() if matches[0].is_tail else parent
+
+
+def _find_first_element(html: str, tag: str, class_name: str, chunk_size: int = 16384):
+    """First <tag> carrying class_name, fed to an lxml pull parser in chunks so the rest of the page is never parsed"""
+    parser = etree.HTMLPullParser(events=('end',), tag=tag)
+    for start in range(0, len(html), chunk_size):
+        parser.feed(html[start:start + chunk_size])
+        for _, element in parser.read_events():
+            if class_name in (element.get('class') or '').split():
+                return element
+    
+    if html:
+        parser.close()
+        for _, element in parser.read_events():
+            if class_name in (element.get('class') or '').split():
+                return element
+    return None
+
+
+def _element_text(element) -> str:
+    """Stripped text of an lxml element and its descendants"""
+    return ''.join(element.itertext()).strip()
+
 
 class EconomicDataCollector:
     """Collector for macroeconomic data from government sources"""
     
     def __init__(self):
         self.session: Optional[aiohttp.ClientSession] = None
-        self.last_request_time = {}
+        self.last_request_time: Dict[str, float] = {}
+        self._domain_locks: Dict[str, asyncio.Lock] = {}
+        # Caps in-flight requests once the dashboard fans out across every source
+        self._sem = asyncio.Semaphore(10)
 
         # Initialize advanced components
         self.analysis_enhanced = True
         self.min_delay = 1.0  # Rate limiting
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            # aiohttp decodes these transparently; br needs the brotli package
+            'Accept-Encoding': 'gzip, deflate, br'
         }
 
     async def rate_limit(self, url: str):
-        """Implement rate limiting per domain"""
-        from urllib.parse import urlparse
-        domain = urlparse(url).netloc
-        
-        if domain in self.last_request_time:
-            elapsed = time.time() - self.last_request_time[domain]
-            if elapsed < self.min_delay:
-                await asyncio.sleep(self.min_delay - elapsed)
+        """Implement rate limiting per domain; concurrent requests to one host are spaced min_delay apart"""
+        domain = _domain_of(url)
+        lock = self._domain_locks.setdefault(domain, asyncio.Lock())
         
-        self.last_request_time[domain] = time.time()
+        async with lock:
+            if domain in self.last_request_time:
+                elapsed = time.monotonic() - self.last_request_time[domain]
+                if elapsed < self.min_delay:
+                    await asyncio.sleep(self.min_delay - elapsed)
+            
+            self.last_request_time[domain] = time.monotonic()
             
     async def setup(self):
         """Setup aiohttp session"""
         if not self.session or self.session.closed:
-            self.session = aiohttp.ClientSession(headers=self.headers)
+            connector = aiohttp.TCPConnector(limit=20, limit_per_host=4, ttl_dns_cache=300)
+            self.session = aiohttp.ClientSession(headers=self.headers, connector=connector)
     
     async def cleanup(self):
         """Cleanup aiohttp session"""
         if self.session:
             await self.session.close()
     
+    async def _fetch(self, url: str, ttl: int) -> str:
+        """Page body from the disk cache while younger than ttl, otherwise a conditional GET.
+        
+        If the GET still fails after its retries, a stale cached copy is served rather than nothing.
+        """
+        # sqlite + pickle block, so the disk cache is consulted off the event loop
+        cached = await asyncio.to_thread(disk_cache.get_sync, 'http_response', url)
+        if cached and time.time() - cached['fetched_at'] < ttl:
+            return cached['body']
+        
+        try:
+            return await self._fetch_remote(url, cached)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if cached:
+                return cached['body']
+            raise
+    
+    @async_retry()
+    async def _fetch_remote(self, url: str, cached: Optional[Dict[str, Any]]) -> str:
+        """GET url, revalidating the cached copy if there is one; error statuses raise so they can be retried"""
+        headers = {}
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached and cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        
+        # Spaced before taking a semaphore slot, so waiting on one host never holds up the others
+        await self.rate_limit(url)
+        async with self._sem, self.session.get(url, headers=headers) as response:
+            if response.status == 304 and cached:
+                body = cached['body']
+            else:
+                response.raise_for_status()
+                body = await response.text()
+                if response.status != 200:
+                    return body
+            etag = response.headers.get('ETag') or (cached or {}).get('etag')
+            last_modified = response.headers.get('Last-Modified') or (cached or {}).get('last_modified')
+        
+        await asyncio.to_thread(disk_cache.set_sync, 'http_response', url, {
+            'body': body,
+            'fetched_at': time.time(),
+            'etag': etag,
+            'last_modified': last_modified
+        }, None, STALE_RETENTION)
+        return body
+    
+    @async_ttl_cache(ttl=SERIES_TTL)
     async def scrape_fred_data(self, series_id: str) -> Dict[str, Any]:
-        """Scrape data from Federal Reserve Economic Data (FRED)"""
-        url = f"https://fred.stlouisfed.org/series/{series_id}"
+        """Get recent observations and metadata for a Federal Reserve Economic Data (FRED) series"""
+        # Bounded by a start date, otherwise the export carries the series' entire history
+        start = (datetime.now() - timedelta(days=FRED_SERIES_LOOKBACK_DAYS)).strftime('%Y-%m-%d')
+        url = f"https://fred.stlouisfed.org/graph/fredgraph.csv?id={series_id}&cosd={start}"
         
         try:
-            async with self.session.get(url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                fred_data = {
-                    'series_id': series_id,
-                    'source': 'fred',
-                    'metadata': {},
-                    'recent_values': [],
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                # Extract series metadata
-                title_elem = soup.find('h1', {'class': 'series-title'})
-                if title_elem:
-                    fred_data['metadata']['title'] = title_elem.text.strip()
-                
-                # Extract units and frequency
-                meta_items = soup.find_all('div', {'class': 'series-meta-item'})
-                for item in meta_items:
-                    label = item.find('div', {'class': 'series-meta-label'})
-                    value = item.find('div', {'class': 'series-meta-value'})
-                    if label and value:
-                        label_text = label.text.strip().lower()
-                        if 'units' in label_text:
-                            fred_data['metadata']['units'] = value.text.strip()
-                        elif 'frequency' in label_text:
-                            fred_data['metadata']['frequency'] = value.text.strip()
-                
-                # Extract recent data points
-                data_table = soup.find('table', {'class': 'series-obs-table'})
-                if data_table:
-                    rows = data_table.find_all('tr')[1:11]  # Last 10 observations
-                    for row in rows:
-                        cells = row.find_all('td')
-                        if len(cells) >= 2:
-                            fred_data['recent_values'].append({
-                                'date': cells[0].text.strip(),
-                                'value': cells[1].text.strip()
-                            })
-                
-                return fred_data
+            # Observations come from the small CSV export; metadata from the (rarely changing) series page,
+            # which well-known series skip entirely
+            if series_id in _FRED_STATIC:
+                csv_text = await self._fetch(url, ttl=SERIES_TTL)
+                metadata = dict(_FRED_STATIC[series_id])
+            else:
+                csv_text, metadata = await asyncio.gather(
+                    self._fetch(url, ttl=SERIES_TTL),
+                    self._fred_metadata(series_id),
+                    return_exceptions=True
+                )
+                if isinstance(csv_text, Exception):
+                    raise csv_text
+                if isinstance(metadata, Exception):
+                    metadata = {}
+            
+            observations = await asyncio.to_thread(_fred_csv_observations, csv_text, series_id)
+            fred_data = {
+                'series_id': series_id,
+                'source': 'fred',
+                'metadata': metadata,
+                'recent_values': observations[:10],  # Last 10 observations
+                'timestamp': _now_iso()
+            }
+            
+            return fred_data
         
         except Exception as e:
             return {'error': f"Failed to scrape FRED data: {str(e)}"}
     
+    @async_ttl_cache(ttl=SERIES_TTL)
+    async def _fetch_fred_batch(self, series_ids: Tuple[str, ...]) -> Dict[str, List[Dict[str, str]]]:
+        """Recent observations (most recent first) for several FRED series from one fredgraph.csv request"""
+        # Only the last year is requested; one start date per series, comma-separated like the ids
+        start = (datetime.now() - timedelta(days=FRED_BATCH_LOOKBACK_DAYS)).strftime('%Y-%m-%d')
+        url = (
+            "https://fred.stlouisfed.org/graph/fredgraph.csv"
+            f"?id={','.join(series_ids)}&cosd={','.join([start] * len(series_ids))}"
+        )
+        csv_text = await self._fetch(url, ttl=SERIES_TTL)
+        return await asyncio.to_thread(_fred_csv_columns, csv_text, series_ids)
+    
+    @async_ttl_cache(ttl=CALENDAR_TTL)
+    async def _fred_metadata(self, series_id: str) -> Dict[str, str]:
+        """Title, units and frequency from a FRED series page"""
+        url = f"https://fred.stlouisfed.org/series/{series_id}"
+        html = await self._fetch(url, ttl=CALENDAR_TTL)
+        return await asyncio.to_thread(self._parse_fred_metadata, html)
+    
+    @staticmethod
+    def _parse_fred_metadata(html: str) -> Dict[str, str]:
+        """Title, units and frequency from the parsed series page"""
+        soup = _parse(html, _FRED_META_STRAINER)
+        metadata = {}
+        
+        # Extract series metadata
+        title_elem = soup.find('h1', {'class': 'series-title'})
+        if title_elem:
+            metadata['title'] = title_elem.text.strip()
+        
+        # Extract units and frequency
+        meta_items = soup.find_all('div', {'class': 'series-meta-item'})
+        for item in meta_items:
+            label = item.find('div', {'class': 'series-meta-label'})
+            value = item.find('div', {'class': 'series-meta-value'})
+            if label and value:
+                label_text = label.text.strip().lower()
+                if 'units' in label_text:
+                    metadata['units'] = value.text.strip()
+                elif 'frequency' in label_text:
+                    metadata['frequency'] = value.text.strip()
+        
+        return metadata
+    
+    @async_ttl_cache(ttl=SERIES_TTL)
     async def get_treasury_yields(self) -> Dict[str, Any]:
         """Get current Treasury yield curve data"""
         url = "https://www.treasury.gov/resource-center/data-chart-center/interest-rates/pages/textview.aspx?data=yield"
         
         try:
-            async with self.session.get(url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                yield_data = {
-                    'source': 'us_treasury',
-                    'yield_curve': {},
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                # Find the yield table
-                table = soup.find('table', {'class': 't-chart'})
-                if table:
-                    # Get headers (maturities)
-                    headers = []
-                    header_row = table.find('tr')
-                    if header_row:
-                        for th in header_row.find_all('th')[1:]:  # Skip date column
-                            headers.append(th.text.strip())
-                    
-                    # Get most recent yields
-                    data_rows = table.find_all('tr')[1:]
-                    if data_rows:
-                        latest_row = data_rows[-1]  # Most recent data
-                        cells = latest_row.find_all('td')
-                        
-                        if cells:
-                            yield_data['date'] = cells[0].text.strip()
-                            for i, header in enumerate(headers, 1):
-                                if i < len(cells):
-                                    yield_data['yield_curve'][header] = cells[i].text.strip()
-                
-                # Calculate spread metrics
-                if '2 yr' in yield_data['yield_curve'] and '10 yr' in yield_data['yield_curve']:
-                    try:
-                        two_year = float(yield_data['yield_curve']['2 yr'])
-                        ten_year = float(yield_data['yield_curve']['10 yr'])
-                        yield_data['spreads'] = {
-                            '2s10s': f"{ten_year - two_year:.2f}",
-                            'inverted': ten_year < two_year
-                        }
-                    except:
-                        pass
-                
-                return yield_data
+            html = await self._fetch(url, ttl=SERIES_TTL)
+            
+            yield_data = {
+                'source': 'us_treasury',
+                'yield_curve': {},
+                'timestamp': _now_iso()
+            }
+            yield_data.update(await asyncio.to_thread(self._parse_treasury_yields, html))
+            
+            # Calculate spread metrics
+            if '2 yr' in yield_data['yield_curve'] and '10 yr' in yield_data['yield_curve']:
+                try:
+                    two_year = float(yield_data['yield_curve']['2 yr'])
+                    ten_year = float(yield_data['yield_curve']['10 yr'])
+                    yield_data['spreads'] = {
+                        '2s10s': f"{ten_year - two_year:.2f}",
+                        'inverted': ten_year < two_year
+                    }
+                except:
+                    pass
+            
+            return yield_data
         
         except Exception as e:
             return {'error': f"Failed to scrape Treasury yields: {str(e)}"}
     
+    @staticmethod
+    def _parse_treasury_yields(html: str) -> Dict[str, Any]:
+        """Latest date and yield per maturity from the Treasury yield table"""
+        parsed = {'yield_curve': {}}
+        
+        # Find the yield table; parsing stops once it has been closed
+        table = _find_first_element(html, 'table', 't-chart')
+        if table is not None:
+            rows = table.xpath('.//tr')
+            
+            # Get headers (maturities)
+            headers = []
+            if rows:
+                for th in rows[0].xpath('.//th')[1:]:  # Skip date column
+                    headers.append(_element_text(th))
+            
+            # Get most recent yields
+            if len(rows) > 1:
+                cells = [_element_text(td) for td in rows[-1].xpath('.//td')]  # Most recent data
+                
+                if cells:
+                    parsed['date'] = cells[0]
+                    for i, header in enumerate(headers, 1):
+                        if i < len(cells):
+                            parsed['yield_curve'][header] = cells[i]
+        
+        return parsed
+    
+    @async_ttl_cache(ttl=RELEASE_TTL)
     async def get_bls_employment_data(self) -> Dict[str, Any]:
         """Get employment data from Bureau of Labor Statistics"""
         url = "https://www.bls.gov/news.release/empsit.nr0.htm"
         
         try:
-            async with self.session.get(url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                employment_data = {
-                    'source': 'bls',
-                    'unemployment_rate': {},
-                    'nonfarm_payrolls': {},
-                    'wage_growth': {},
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                # Extract key employment metrics from the text
-                text_content = soup.get_text()
-                
-                # Unemployment rate
-                unemployment_match = re.search(r'unemployment rate.*?(\d+\.\d+)\s*percent', text_content, re.I)
-                if unemployment_match:
-                    employment_data['unemployment_rate']['current'] = unemployment_match.group(1)
-                
-                # Nonfarm payrolls
-                payrolls_match = re.search(r'nonfarm payroll employment.*?(\d+,?\d*)\s*(?:thousand|,000)', text_content, re.I)
-                if payrolls_match:
-                    employment_data['nonfarm_payrolls']['change'] = payrolls_match.group(1)
-                
-                # Average hourly earnings
-                wage_match = re.search(r'average hourly earnings.*?(\d+\.\d+)\s*percent', text_content, re.I)
-                if wage_match:
-                    employment_data['wage_growth']['year_over_year'] = wage_match.group(1)
-                
-                return employment_data
+            html = await self._fetch(url, ttl=RELEASE_TTL)
+            
+            employment_data = {
+                'source': 'bls',
+                'unemployment_rate': {},
+                'nonfarm_payrolls': {},
+                'wage_growth': {},
+                'timestamp': _now_iso()
+            }
+            employment_data.update(await asyncio.to_thread(self._parse_employment_release, html))
+            
+            return employment_data
         
         except Exception as e:
             return {'error': f"Failed to scrape BLS data: {str(e)}"}
     
+    @staticmethod
+    def _parse_employment_release(html: str) -> Dict[str, Dict[str, str]]:
+        """Headline figures from the Employment Situation release body"""
+        parsed = {'unemployment_rate': {}, 'nonfarm_payrolls': {}, 'wage_growth': {}}
+        
+        # Extract key employment metrics from the release body
+        text_content = _page_text(html, BLS_RELEASE_XPATH)
+        
+        # Unemployment rate
+        unemployment_match = _UNEMPLOYMENT_RE.search(text_content)
+        if unemployment_match:
+            parsed['unemployment_rate']['current'] = unemployment_match.group(1)
+        
+        # Nonfarm payrolls
+        payrolls_match = _PAYROLLS_RE.search(text_content)
+        if payrolls_match:
+            parsed['nonfarm_payrolls']['change'] = payrolls_match.group(1)
+        
+        # Average hourly earnings
+        wage_match = _WAGE_RE.search(text_content)
+        if wage_match:
+            parsed['wage_growth']['year_over_year'] = wage_match.group(1)
+        
+        return parsed
+    
+    @async_ttl_cache(ttl=RELEASE_TTL)
     async def get_inflation_data(self) -> Dict[str, Any]:
         """Get inflation data (CPI) from BLS"""
         url = "https://www.bls.gov/news.release/cpi.nr0.htm"
         
         try:
-            async with self.session.get(url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                inflation_data = {
-                    'source': 'bls_cpi',
-                    'headline_cpi': {},
-                    'core_cpi': {},
-                    'categories': {},
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                text_content = soup.get_text()
-                
-                # Headline CPI
-                headline_match = re.search(r'Consumer Price Index.*?(\d+\.\d+)\s*percent.*?12 months', text_content, re.I)
-                if headline_match:
-                    inflation_data['headline_cpi']['year_over_year'] = headline_match.group(1)
-                
-                # Core CPI (excluding food and energy)
-                core_match = re.search(r'excluding food and energy.*?(\d+\.\d+)\s*percent.*?12 months', text_content, re.I)
-                if core_match:
-                    inflation_data['core_cpi']['year_over_year'] = core_match.group(1)
-                
-                # Category breakdowns
-                categories = ['food', 'energy', 'shelter', 'medical', 'transportation']
-                for category in categories:
-                    cat_match = re.search(rf'{category}.*?(\d+\.\d+)\s*percent', text_content, re.I)
-                    if cat_match:
-                        inflation_data['categories'][category] = cat_match.group(1)
-                
-                return inflation_data
+            html = await self._fetch(url, ttl=RELEASE_TTL)
+            
+            inflation_data = {
+                'source': 'bls_cpi',
+                'headline_cpi': {},
+                'core_cpi': {},
+                'categories': {},
+                'timestamp': _now_iso()
+            }
+            inflation_data.update(await asyncio.to_thread(self._parse_cpi_release, html))
+            
+            return inflation_data
         
         except Exception as e:
             return {'error': f"Failed to scrape inflation data: {str(e)}"}
     
+    @staticmethod
+    def _parse_cpi_release(html: str) -> Dict[str, Dict[str, str]]:
+        """Headline, core and category CPI changes from the release body"""
+        parsed = {'headline_cpi': {}, 'core_cpi': {}}
+        text_content = _page_text(html, BLS_RELEASE_XPATH)
+        
+        # Headline CPI
+        headline_match = _HEADLINE_CPI_RE.search(text_content)
+        if headline_match:
+            parsed['headline_cpi']['year_over_year'] = headline_match.group(1)
+        
+        # Core CPI (excluding food and energy)
+        core_match = _CORE_CPI_RE.search(text_content)
+        if core_match:
+            parsed['core_cpi']['year_over_year'] = core_match.group(1)
+        
+        # Category breakdowns
+        parsed['categories'] = _scan_cpi_categories(text_content)
+        
+        return parsed
+    
+    @async_ttl_cache(ttl=RELEASE_TTL)
     async def get_gdp_data(self) -> Dict[str, Any]:
         """Get GDP data from Bureau of Economic Analysis"""
         url = "https://www.bea.gov/news/current-releases"
         
         try:
-            async with self.session.get(url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                gdp_data = {
-                    'source': 'bea',
-                    'real_gdp': {},
-                    'nominal_gdp': {},
-                    'gdp_components': {},
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                # Find GDP release
-                gdp_link = soup.find('a', text=re.compile('Gross Domestic Product', re.I))
-                if gdp_link:
-                    gdp_url = 'https://www.bea.gov' + gdp_link.get('href', '')
-                    
-                    async with self.session.get(gdp_url) as gdp_response:
-                        gdp_html = await gdp_response.text()
-                        gdp_soup = BeautifulSoup(gdp_html, 'html.parser')
-                        
-                        text_content = gdp_soup.get_text()
-                        
-                        # Real GDP growth
-                        real_gdp_match = re.search(r'real.*?GDP.*?(\d+\.\d+)\s*percent.*?annual rate', text_content, re.I)
-                        if real_gdp_match:
-                            gdp_data['real_gdp']['quarterly_annualized'] = real_gdp_match.group(1)
-                        
-                        # Components
-                        components = {
-                            'consumption': 'personal consumption',
-                            'investment': 'gross private.*?investment',
-                            'government': 'government.*?expenditures',
-                            'net_exports': 'net exports'
-                        }
-                        
-                        for key, pattern in components.items():
-                            comp_match = re.search(rf'{pattern}.*?(\d+\.\d+)\s*percent', text_content, re.I)
-                            if comp_match:
-                                gdp_data['gdp_components'][key] = comp_match.group(1)
+            html = await self._fetch(url, ttl=RELEASE_TTL)
+            
+            gdp_data = {
+                'source': 'bea',
+                'real_gdp': {},
+                'nominal_gdp': {},
+                'gdp_components': {},
+                'timestamp': _now_iso()
+            }
+            
+            # Find GDP release; the listing response is released before following the link
+            gdp_href = await asyncio.to_thread(self._find_gdp_release_href, html)
+            if gdp_href is not None:
+                gdp_url = 'https://www.bea.gov' + gdp_href
                 
-                return gdp_data
+                gdp_html = await self._fetch(gdp_url, ttl=RELEASE_TTL)
+                gdp_data.update(await asyncio.to_thread(self._parse_gdp_release, gdp_html))
+            
+            return gdp_data
         
         except Exception as e:
             return {'error': f"Failed to scrape GDP data: {str(e)}"}
     
+    @staticmethod
+    def _find_gdp_release_href(html: str) -> Optional[str]:
+        """Relative link to the GDP release on the BEA current-releases listing, or None"""
+        gdp_link = _parse(html, _LINK_STRAINER).find('a', text=_GDP_LINK_RE)
+        return gdp_link.get('href', '') if gdp_link else None
+    
+    @staticmethod
+    def _parse_gdp_release(html: str) -> Dict[str, Dict[str, str]]:
+        """Real GDP growth and component contributions from a BEA release page"""
+        parsed = {'real_gdp': {}, 'gdp_components': {}}
+        text_content = _page_text(html)
+        
+        # Real GDP growth
+        real_gdp_match = _REAL_GDP_RE.search(text_content)
+        if real_gdp_match:
+            parsed['real_gdp']['quarterly_annualized'] = real_gdp_match.group(1)
+        
+        # Components
+        for key, pattern in _GDP_COMPONENT_RES.items():
+            comp_match = pattern.search(text_content)
+            if comp_match:
+                parsed['gdp_components'][key] = comp_match.group(1)
+        
+        return parsed
+    
+    @async_ttl_cache(ttl=CALENDAR_TTL)
     async def get_fed_policy_data(self) -> Dict[str, Any]:
         """Get Federal Reserve policy data and meeting minutes"""
         url = "https://www.federalreserve.gov/monetarypolicy/fomccalendars.htm"
         
         try:
-            async with self.session.get(url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                fed_data = {
-                    'source': 'federal_reserve',
-                    'current_rate': {},
-                    'meeting_dates': [],
-                    'recent_decisions': [],
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                # Extract current fed funds rate
-                rate_elem = soup.find(text=re.compile('federal funds rate', re.I))
-                if rate_elem:
-                    rate_text = rate_elem.parent.get_text()
-                    rate_match = re.search(r'(\d+\.?\d*)\s*to\s*(\d+\.?\d*)\s*percent', rate_text)
-                    if rate_match:
-                        fed_data['current_rate'] = {
-                            'lower_bound': rate_match.group(1),
-                            'upper_bound': rate_match.group(2),
-                            'midpoint': f"{(float(rate_match.group(1)) + float(rate_match.group(2))) / 2:.2f}"
-                        }
-                
-                # Extract meeting dates
-                meeting_divs = soup.find_all('div', {'class': 'fomc-meeting'})
-                for meeting in meeting_divs[:5]:  # Next 5 meetings
-                    date_elem = meeting.find('div', {'class': 'fomc-date'})
-                    if date_elem:
-                        fed_data['meeting_dates'].append(date_elem.text.strip())
-                
-                return fed_data
+            html = await self._fetch(url, ttl=CALENDAR_TTL)
+            
+            fed_data = {
+                'source': 'federal_reserve',
+                'current_rate': {},
+                'meeting_dates': [],
+                'recent_decisions': [],
+                'timestamp': _now_iso()
+            }
+            fed_data.update(await asyncio.to_thread(self._parse_fomc_calendar, html))
+            
+            return fed_data
         
         except Exception as e:
             return {'error': f"Failed to scrape Fed data: {str(e)}"}
     
+    @staticmethod
+    def _parse_fomc_calendar(html: str) -> Dict[str, Any]:
+        """Target range and upcoming meeting dates from the FOMC calendar page"""
+        parsed = {'current_rate': {}, 'meeting_dates': []}
+        tree = _html_tree(html)
+        
+        # Extract current fed funds rate
+        rate_elem = _text_parent(tree, 'federal funds rate')
+        if rate_elem is not None:
+            rate_text = rate_elem.text_content()
+            rate_match = _FED_RATE_RANGE_RE.search(rate_text)
+            if rate_match:
+                parsed['current_rate'] = {
+                    'lower_bound': rate_match.group(1),
+                    'upper_bound': rate_match.group(2),
+                    'midpoint': f"{(float(rate_match.group(1)) + float(rate_match.group(2))) / 2:.2f}"
+                }
+        
+        # Extract meeting dates
+        meeting_divs = tree.xpath("//div[contains(concat(' ', normalize-space(@class), ' '), ' fomc-meeting ')]")
+        for meeting in meeting_divs[:5]:  # Next 5 meetings
+            date_elems = meeting.xpath(".//div[contains(concat(' ', normalize-space(@class), ' '), ' fomc-date ')]")
+            if date_elems:
+                parsed['meeting_dates'].append(date_elems[0].text_content().strip())
+        
+        return parsed
+    
     async def get_housing_data(self) -> Dict[str, Any]:
         """Get housing market data from various sources"""
         housing_data = {
@@ -366,44 +779,58 @@ class EconomicDataCollector:
             'home_prices': {},
             'sales_data': {},
             'mortgage_rates': {},
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         }
         
-        # Get mortgage rates from Freddie Mac
+        # Freddie Mac and Census are independent hosts, so fetch both at once
+        mortgage_rate, housing_starts = await asyncio.gather(
+            self._fetch_mortgage_rate(),
+            self._fetch_housing_starts()
+        )
+        if mortgage_rate:
+            housing_data['mortgage_rates']['30_year'] = mortgage_rate
+        if housing_starts:
+            housing_data['sales_data']['housing_starts'] = housing_starts
+        
+        return housing_data
+    
+    async def _fetch_mortgage_rate(self) -> Optional[str]:
+        """30-year mortgage rate from Freddie Mac's PMMS page, or None if unavailable"""
         mortgage_url = "http://www.freddiemac.com/pmms/"
         
         try:
-            async with self.session.get(mortgage_url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Extract 30-year mortgage rate
-                rate_elem = soup.find(text=re.compile('30-year', re.I))
-                if rate_elem:
-                    rate_text = rate_elem.parent.parent.get_text()
-                    rate_match = re.search(r'(\d+\.\d+)%', rate_text)
-                    if rate_match:
-                        housing_data['mortgage_rates']['30_year'] = rate_match.group(1)
+            html = await self._fetch(mortgage_url, ttl=RELEASE_TTL)
+            return await asyncio.to_thread(self._parse_mortgage_rate, html)
         except:
             pass
-        
-        # Get housing starts from Census
+        return None
+    
+    @staticmethod
+    def _parse_mortgage_rate(html: str) -> Optional[str]:
+        """30-year rate from the PMMS page, or None"""
+        # Extract 30-year mortgage rate
+        rate_elem = _text_parent(_html_tree(html), '30-year')
+        if rate_elem is not None and rate_elem.getparent() is not None:
+            rate_text = rate_elem.getparent().text_content()
+            rate_match = _MORTGAGE_RATE_RE.search(rate_text)
+            if rate_match:
+                return rate_match.group(1)
+        return None
+    
+    async def _fetch_housing_starts(self) -> Optional[str]:
+        """Housing starts (thousands, SAAR) from the Census new residential construction page, or None"""
         starts_url = "https://www.census.gov/construction/nrc/index.html"
         
         try:
-            async with self.session.get(starts_url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Extract housing starts data
-                text_content = soup.get_text()
-                starts_match = re.search(r'housing starts.*?(\d+,?\d*)\s*thousand', text_content, re.I)
-                if starts_match:
-                    housing_data['sales_data']['housing_starts'] = starts_match.group(1)
+            html = await self._fetch(starts_url, ttl=RELEASE_TTL)
+            
+            # Extract housing starts data
+            starts_match = await asyncio.to_thread(_search_page_text, html, _HOUSING_STARTS_RE)
+            if starts_match:
+                return starts_match.group(1)
         except:
             pass
-        
-        return housing_data
+        return None
     
     async def get_consumer_confidence(self) -> Dict[str, Any]:
         """Get consumer confidence indicators"""
@@ -412,7 +839,7 @@ class EconomicDataCollector:
             'michigan_sentiment': {},
             'conference_board': {},
             'retail_sales': {},
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _now_iso()
         }
         
         # This would typically scrape from Conference Board and U Michigan sites
@@ -422,19 +849,15 @@ class EconomicDataCollector:
         retail_url = "https://www.census.gov/retail/index.html"
         
         try:
-            async with self.session.get(retail_url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                text_content = soup.get_text()
-                retail_match = re.search(r'retail.*?sales.*?(\d+\.\d+)\s*percent', text_content, re.I)
-                if retail_match:
-                    confidence_data['retail_sales']['monthly_change'] = retail_match.group(1)
+            html = await self._fetch(retail_url, ttl=RELEASE_TTL)
+            retail_match = await asyncio.to_thread(_search_page_text, html, _RETAIL_SALES_RE)
+            if retail_match:
+                confidence_data['retail_sales']['monthly_change'] = retail_match.group(1)
         except:
             pass
         
         return confidence_data
-    
+
     async def get_comprehensive_economic_data(self) -> Dict[str, Any]:
         """Get comprehensive economic indicators dashboard"""
         # Key FRED series IDs
@@ -450,7 +873,7 @@ class EconomicDataCollector:
         }
         
         economic_dashboard = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _now_iso(),
             'indicators': {},
             'yield_curve': {},
             'labor_market': {},
@@ -460,40 +883,51 @@ class EconomicDataCollector:
             'market_conditions': {}
         }
         
-        # Gather all data
+        # Every source is an independent host; fetch them concurrently
+        indicators, yields, employment, inflation, gdp, fed, housing, consumer = await gather_sources(
+            self._fetch_fred_batch(tuple(fred_series.values())),
+            self.get_treasury_yields(),
+            self.get_bls_employment_data(),
+            self.get_inflation_data(),
+            self.get_gdp_data(),
+            self.get_fed_policy_data(),
+            self.get_housing_data(),
+            self.get_consumer_confidence()
+        )
+        
+        # Latest observation of each key FRED series
+        if not indicators.get('error'):
+            for name, series_id in fred_series.items():
+                observations = indicators.get(series_id)
+                if observations:
+                    economic_dashboard['indicators'][name] = {'series_id': series_id, **observations[0]}
+        
         # Treasury yields
-        yields = await self.get_treasury_yields()
         if not yields.get('error'):
-            economic_dashboard['yield_curve'] = yields.get('yield_curve', {})
+            economic_dashboard['yield_curve'] = dict(yields.get('yield_curve', {}))
             economic_dashboard['yield_curve']['spreads'] = yields.get('spreads', {})
         
         # Employment
-        employment = await self.get_bls_employment_data()
         if not employment.get('error'):
             economic_dashboard['labor_market'] = employment
         
         # Inflation
-        inflation = await self.get_inflation_data()
         if not inflation.get('error'):
             economic_dashboard['inflation'] = inflation
         
         # GDP
-        gdp = await self.get_gdp_data()
         if not gdp.get('error'):
             economic_dashboard['growth'] = gdp
         
         # Fed Policy
-        fed = await self.get_fed_policy_data()
         if not fed.get('error'):
             economic_dashboard['policy'] = fed
         
         # Housing
-        housing = await self.get_housing_data()
         if not housing.get('error'):
             economic_dashboard['market_conditions']['housing'] = housing
         
         # Consumer
-        consumer = await self.get_consumer_confidence()
         if not consumer.get('error'):
             economic_dashboard['market_conditions']['consumer'] = consumer
         
@@ -512,41 +946,19 @@ class EconomicDataCollector:
             'key_risks': []
         }
         
-        # Analyze yield curve
-        if data.get('yield_curve', {}).get('spreads', {}).get('inverted'):
-            summary['key_risks'].append('Inverted yield curve signals recession risk')
-            summary['growth_outlook'] = 'weakening'
-        
-        # Analyze unemployment
-        try:
-            unemployment = float(data.get('labor_market', {}).get('unemployment_rate', {}).get('current', '4.0'))
-            if unemployment < 4.0:
-                summary['labor_market_strength'] = 'very strong'
-            elif unemployment > 5.0:
-                summary['labor_market_strength'] = 'weakening'
-        except:
-            pass
-        
-        # Analyze inflation
-        try:
-            core_cpi = float(data.get('inflation', {}).get('core_cpi', {}).get('year_over_year', '2.0'))
-            if core_cpi > 3.0:
-                summary['inflation_pressure'] = 'elevated'
-                summary['key_risks'].append('Persistent inflation may require tighter policy')
-            elif core_cpi < 2.0:
-                summary['inflation_pressure'] = 'low'
-        except:
-            pass
-        
-        # Analyze Fed policy
-        try:
-            fed_rate = float(data.get('policy', {}).get('current_rate', {}).get('midpoint', '5.0'))
-            if fed_rate > 5.0:
-                summary['policy_stance'] = 'restrictive'
-            elif fed_rate < 2.0:
-                summary['policy_stance'] = 'accommodative'
-        except:
-            pass
+        for path, parse, classify in _OUTLOOK_RULES:
+            value = reduce(lambda node, key: node.get(key) if isinstance(node, dict) else None, path, data)
+            if value is None:
+                continue
+            try:
+                verdict = classify(parse(value))
+            except (TypeError, ValueError):
+                continue
+            if verdict:
+                field, label, risk = verdict
+                summary[field] = label
+                if risk:
+                    summary['key_risks'].append(risk)
         
         return summary
 
@@ -633,15 +1045,13 @@ async def list_tools() -> List[Tool]:
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> List[TextContent]:
-    await collector.setup()
-    
     try:
         if name == "get_treasury_yields":
             yield_data = await collector.get_treasury_yields()
             
             return [TextContent(
                 type="text",
-                text=json.dumps(yield_data, indent=2)
+                text=_dump(yield_data)
             )]
         
         elif name == "get_employment_data":
@@ -649,7 +1059,7 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
             
             return [TextContent(
                 type="text",
-                text=json.dumps(employment_data, indent=2)
+                text=_dump(employment_data)
             )]
         
         elif name == "get_inflation_data":
@@ -657,7 +1067,7 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
             
             return [TextContent(
                 type="text",
-                text=json.dumps(inflation_data, indent=2)
+                text=_dump(inflation_data)
             )]
         
         elif name == "get_gdp_data":
@@ -665,7 +1075,7 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
             
             return [TextContent(
                 type="text",
-                text=json.dumps(gdp_data, indent=2)
+                text=_dump(gdp_data)
             )]
         
         elif name == "get_fed_policy":
@@ -673,7 +1083,7 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
             
             return [TextContent(
                 type="text",
-                text=json.dumps(fed_data, indent=2)
+                text=_dump(fed_data)
             )]
         
         elif name == "get_fred_series":
@@ -682,7 +1092,7 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
             
             return [TextContent(
                 type="text",
-                text=json.dumps(fred_data, indent=2)
+                text=_dump(fred_data)
             )]
         
         elif name == "get_housing_market_data":
@@ -690,7 +1100,7 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
             
             return [TextContent(
                 type="text",
-                text=json.dumps(housing_data, indent=2)
+                text=_dump(housing_data)
             )]
         
         elif name == "get_economic_dashboard":
@@ -698,7 +1108,7 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
             
             return [TextContent(
                 type="text",
-                text=json.dumps(dashboard, indent=2)
+                text=_dump(dashboard)
             )]
         
         else:
@@ -710,23 +1120,25 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
     except Exception as e:
         return [TextContent(
             type="text",
-            text=json.dumps({"error": str(e)}, indent=2)
+            text=_dump({"error": str(e)})
         )]
-    
-    finally:
-        await collector.cleanup()
 
 async def main():
-    async with stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="economic-data-collector",
-                server_version="0.1.0",
-                capabilities={}
+    # One pooled session for the server's lifetime keeps TCP/TLS connections and DNS warm between calls
+    await collector.setup()
+    try:
+        async with stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="economic-data-collector",
+                    server_version="0.1.0",
+                    capabilities={}
+                )
             )
-        )
+    finally:
+        await collector.cleanup()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -1,56 +1,422 @@
 import time
 #!/usr/bin/env python
 
-import json
 import asyncio
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import random
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 import re
 import statistics
+from urllib.parse import urlparse
 
 import aiohttp
-from bs4 import BeautifulSoup
+import lxml.html
+import orjson
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.types import Tool, TextContent
 import mcp.server.stdio as stdio
 
 import asyncio
-from functools import wraps
+from collections import OrderedDict
+from functools import lru_cache, wraps
 
 # Import advanced modules
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent / "shared"))
 
+from data_cache import FinancialDataCache
+
+# Seconds a fetched source page is reused before it is requested again
+DAMODARAN_TTL = 24 * 3600    # Damodaran's industry datasets are refreshed a few times a year
+TREASURY_TTL = 3600          # Treasury yields move daily
+
+disk_cache = FinancialDataCache()
+
+
+# Network failures worth another attempt; parse errors and the like are not
+TRANSIENT_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Error statuses only count as transient when the server is throttling (429) or failing (5xx)"""
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status == 429 or exc.status >= 500
+    return isinstance(exc, TRANSIENT_ERRORS)
 
 
 def async_retry(max_attempts=3, delay=1):
-    """Retry decorator for async functions"""
+    """Retry decorator for async functions; only transient failures are retried, with jittered exponential backoff"""
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            last_exception = None
             for attempt in range(max_attempts):
                 try:
                     return await func(*args, **kwargs)
                 except Exception as e:
-                    last_exception = e
-                    if attempt < max_attempts - 1:
-                        await asyncio.sleep(delay * (attempt + 1))
-                    continue
-            raise last_exception
+                    if not _is_transient(e) or attempt == max_attempts - 1:
+                        raise
+                    await asyncio.sleep(delay * 2 ** attempt + random.random() * 0.1)
         return wrapper
     return decorator
 
 
+# Damodaran data rows: a name cell followed by at least one figure
+_DATA_ROW_XPATH = "//table//tr[td[2]]"
+
+# Last row of the first Treasury yield table
+_LATEST_YIELD_ROW_XPATH = "((//table[contains(concat(' ', normalize-space(@class), ' '), ' t-chart ')])[1]//tr)[last()]"
+
+
+@lru_cache(maxsize=8)
+def _html_parser(encoding: Optional[str]) -> lxml.html.HTMLParser:
+    """One reusable HTML parser per response encoding"""
+    return lxml.html.HTMLParser(encoding=encoding)
+
+
+def _html_tree(body: bytes, charset: Optional[str] = None):
+    """lxml.html tree parsed straight from the response bytes (no str decode), or None for an empty page.
+    
+    Without an HTTP charset lxml falls back to the page's own meta declaration.
+    """
+    if not body.strip():
+        return None
+    return lxml.html.fromstring(body, parser=_html_parser(charset))
+
+
+@lru_cache(maxsize=4)
+def _industry_rows(body: bytes, charset: Optional[str]) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """(lowercased industry name, stripped cell texts) for each data row of a Damodaran page.
+    
+    Parsed once per cached page body, so lookups for further industries skip the parse entirely.
+    """
+    tree = _html_tree(body, charset)
+    if tree is None:
+        return ()
+    rows = []
+    for row in tree.xpath(_DATA_ROW_XPATH):
+        cells = tuple(cell.text_content().strip() for cell in row.xpath('./td'))
+        rows.append((cells[0].lower(), cells))
+    return tuple(rows)
+
+
+@lru_cache(maxsize=1)
+def _iso_now_minute(_bucket: int) -> str:
+    return datetime.now().isoformat()
+
+
+def _now_iso() -> str:
+    """ISO timestamp for payload metadata, formatted once per wall-clock minute"""
+    return _iso_now_minute(int(time.time()) // 60)
+
+
+_DECIMAL_RE = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)')
+
+
+def _pct(value: str, default: float) -> float:
+    """Scraped percentage such as '4.18' or '4.18%' as a fraction, or default when it isn't a plain number"""
+    value = value.strip().removesuffix('%').strip()
+    return float(value) / 100 if _DECIMAL_RE.fullmatch(value) else default
+
+
+class IndustryProfile(NamedTuple):
+    """Everything the engine assumes about one industry, so each request needs a single table lookup"""
+    beta: float
+    debt_ratio: float
+    revenue_growth: float
+    earnings_growth: float
+    stage: str
+    gross: float
+    operating: float
+    net: float
+    capex: float  # % of revenue
+    wc: float  # Working capital as % of revenue
+    ev_rev: float
+    ev_ebitda: float
+    pe: float
+    growth_drivers: Tuple[str, ...]
+    risk_factors: Tuple[str, ...]
+    margin_drivers: Tuple[str, ...]
+    multiple_drivers: Tuple[str, ...]
+    extra_multiples: Tuple[Tuple[str, float], ...] = ()  # Sector-specific multiples such as P/B or P/FFO
+    sample_ticker: str = 'SPY'  # Representative company for the industry overview
+    days_sales_outstanding: int = 45
+    days_inventory: int = 30
+
+
+INDUSTRY_TABLE = {
+    'technology': IndustryProfile(
+        beta=1.25, debt_ratio=0.20,
+        revenue_growth=0.15, earnings_growth=0.18, stage='growth',
+        gross=0.65, operating=0.25, net=0.20,
+        capex=0.05, wc=0.10,
+        ev_rev=5.0, ev_ebitda=20.0, pe=25.0,
+        growth_drivers=('Cloud adoption', 'AI/ML integration', 'Digital transformation', 'SaaS conversion'),
+        risk_factors=('Competition', 'Technology obsolescence', 'Regulatory changes', 'Cybersecurity'),
+        margin_drivers=('Scale economies', 'R&D leverage', 'Pricing power', 'Automation'),
+        multiple_drivers=('Growth rate', 'Recurring revenue %', 'Market position', 'Profitability'),
+        sample_ticker='MSFT'
+    ),
+    'retail': IndustryProfile(
+        beta=1.10, debt_ratio=0.35,
+        revenue_growth=0.05, earnings_growth=0.06, stage='mature',
+        gross=0.35, operating=0.08, net=0.05,
+        capex=0.03, wc=0.15,
+        ev_rev=0.8, ev_ebitda=10.0, pe=18.0,
+        growth_drivers=('E-commerce growth', 'Omnichannel strategy', 'Market expansion', 'Customer loyalty'),
+        risk_factors=('Consumer spending', 'E-commerce disruption', 'Inventory management', 'Labor costs'),
+        margin_drivers=('Supply chain efficiency', 'Private label', 'Store optimization', 'Digital sales'),
+        multiple_drivers=('Same-store sales', 'E-commerce mix', 'Market share', 'Margins'),
+        sample_ticker='WMT',
+        days_sales_outstanding=5, days_inventory=60
+    ),
+    'finance': IndustryProfile(
+        beta=1.15, debt_ratio=0.70,
+        revenue_growth=0.06, earnings_growth=0.08, stage='mature',
+        gross=0.90, operating=0.40, net=0.25,
+        capex=0.02, wc=0.05,
+        ev_rev=3.0, ev_ebitda=12.0, pe=15.0,
+        growth_drivers=('Interest rate environment', 'Loan growth', 'Fee income', 'Digital banking'),
+        risk_factors=('Credit risk', 'Interest rate risk', 'Regulatory changes', 'Economic cycles'),
+        margin_drivers=('Net interest margin', 'Fee income', 'Operating leverage', 'Credit quality'),
+        multiple_drivers=('ROE', 'Asset quality', 'Capital ratios', 'Growth'),
+        extra_multiples=(('p_book', 1.5),),
+        sample_ticker='JPM'
+    ),
+    'healthcare': IndustryProfile(
+        beta=0.95, debt_ratio=0.25,
+        revenue_growth=0.08, earnings_growth=0.10, stage='growth',
+        gross=0.70, operating=0.20, net=0.15,
+        capex=0.04, wc=0.20,
+        ev_rev=3.5, ev_ebitda=15.0, pe=20.0,
+        growth_drivers=('Aging population', 'Drug pipeline', 'Market access', 'Pricing power'),
+        risk_factors=('Regulatory approval', 'Pricing pressure', 'Patent expiration', 'R&D risk'),
+        margin_drivers=('Drug mix', 'Pricing', 'R&D efficiency', 'Manufacturing scale'),
+        multiple_drivers=('Pipeline', 'Patent life', 'Market size', 'Margins'),
+        sample_ticker='JNJ'
+    ),
+    'energy': IndustryProfile(
+        beta=1.20, debt_ratio=0.40,
+        revenue_growth=0.04, earnings_growth=0.05, stage='cyclical',
+        gross=0.30, operating=0.15, net=0.10,
+        capex=0.15, wc=0.10,
+        ev_rev=1.5, ev_ebitda=8.0, pe=12.0,
+        growth_drivers=('Commodity prices', 'Production volumes', 'Reserve additions', 'Cost efficiency'),
+        risk_factors=('Commodity volatility', 'Environmental regulation', 'Geopolitical risk', 'Transition risk'),
+        margin_drivers=('Commodity prices', 'Production efficiency', 'Cost discipline', 'Technology'),
+        multiple_drivers=('Reserve life', 'Production growth', 'Cost position', 'Commodity exposure'),
+        sample_ticker='XOM'
+    ),
+    'industrial': IndustryProfile(
+        beta=1.05, debt_ratio=0.30,
+        revenue_growth=0.06, earnings_growth=0.07, stage='mature',
+        gross=0.30, operating=0.12, net=0.08,
+        capex=0.04, wc=0.15,
+        ev_rev=1.5, ev_ebitda=12.0, pe=18.0,
+        growth_drivers=('Economic cycles', 'Infrastructure spending', 'Automation', 'Supply chain'),
+        risk_factors=('Economic cycles', 'Raw material costs', 'Trade policies', 'Labor availability'),
+        margin_drivers=('Capacity utilization', 'Pricing', 'Productivity', 'Mix shift'),
+        multiple_drivers=('Cycle position', 'Market share', 'Margins', 'Growth'),
+        sample_ticker='CAT',
+        days_inventory=60
+    ),
+    'consumer': IndustryProfile(
+        beta=0.90, debt_ratio=0.35,
+        revenue_growth=0.04, earnings_growth=0.05, stage='mature',
+        gross=0.40, operating=0.15, net=0.10,
+        capex=0.03, wc=0.12,
+        ev_rev=2.0, ev_ebitda=12.0, pe=20.0,
+        growth_drivers=('Brand strength', 'Market share', 'Innovation', 'Demographics'),
+        risk_factors=('Consumer preferences', 'Input costs', 'Brand relevance', 'Distribution'),
+        margin_drivers=('Brand premium', 'Cost control', 'Distribution efficiency', 'Product mix'),
+        multiple_drivers=('Brand strength', 'Growth', 'Margins', 'Market position'),
+        sample_ticker='PG',
+        days_inventory=60
+    ),
+    'telecom': IndustryProfile(
+        beta=0.85, debt_ratio=0.50,
+        revenue_growth=0.03, earnings_growth=0.04, stage='mature',
+        gross=0.60, operating=0.20, net=0.12,
+        capex=0.15, wc=0.08,
+        ev_rev=2.0, ev_ebitda=8.0, pe=15.0,
+        growth_drivers=('5G rollout', 'Subscriber growth', 'ARPU trends', 'Network investment'),
+        risk_factors=('Competition', 'Capex requirements', 'Technology shifts', 'Regulation'),
+        margin_drivers=('Network efficiency', 'Customer mix', 'Cost per subscriber', 'Pricing'),
+        multiple_drivers=('Subscriber growth', 'ARPU', 'Market share', 'Network quality'),
+        sample_ticker='VZ'
+    ),
+    'utilities': IndustryProfile(
+        beta=0.65, debt_ratio=0.60,
+        revenue_growth=0.03, earnings_growth=0.03, stage='stable',
+        gross=0.40, operating=0.20, net=0.12,
+        capex=0.20, wc=0.10,
+        ev_rev=2.5, ev_ebitda=10.0, pe=18.0,
+        growth_drivers=('Rate base growth', 'Regulatory support', 'Renewable transition', 'Efficiency'),
+        risk_factors=('Regulatory risk', 'Weather', 'Fuel costs', 'Infrastructure age'),
+        margin_drivers=('Rate recovery', 'Operating efficiency', 'Fuel costs', 'Maintenance'),
+        multiple_drivers=('Rate base growth', 'Regulatory environment', 'Renewable mix', 'Dividend yield'),
+        sample_ticker='NEE'
+    ),
+    'realestate': IndustryProfile(
+        beta=0.75, debt_ratio=0.55,
+        revenue_growth=0.05, earnings_growth=0.06, stage='cyclical',
+        gross=0.70, operating=0.35, net=0.20,
+        capex=0.02, wc=0.05,
+        ev_rev=5.0, ev_ebitda=18.0, pe=20.0,
+        growth_drivers=('Occupancy trends', 'Rent growth', 'Development pipeline', 'Location quality'),
+        risk_factors=('Interest rates', 'Economic cycles', 'Location risk', 'Construction costs'),
+        margin_drivers=('Occupancy', 'Rental rates', 'Operating leverage', 'Property quality'),
+        multiple_drivers=('Location quality', 'Occupancy', 'Rent growth', 'Development pipeline'),
+        extra_multiples=(('p_ffo', 15.0),),
+        sample_ticker='SPG'
+    )
+}
+
+# Profile for industries outside the table, allocated once and shared by every lookup miss
+_DEFAULT_PROFILE = IndustryProfile(
+    beta=1.00, debt_ratio=0.30,
+    revenue_growth=0.05, earnings_growth=0.06, stage='mature',
+    gross=0.40, operating=0.15, net=0.10,
+    capex=0.05, wc=0.10,
+    ev_rev=2.0, ev_ebitda=12.0, pe=18.0,
+    growth_drivers=('Market growth', 'Operational efficiency'),
+    risk_factors=('Market risk', 'Operational risk'),
+    margin_drivers=('Efficiency', 'Scale', 'Pricing'),
+    multiple_drivers=('Growth', 'Profitability', 'Market position', 'Risk profile')
+)
+
+
+
+# Industry-level assumption builders. They do no I/O, so results are memoized; the dicts are shared
+# between calls and must not be mutated (the engine methods wrap them with the caller's ticker).
+@lru_cache(maxsize=256)
+def _growth(industry: str) -> Dict[str, Any]:
+    """Industry-level growth rates, benchmarks, drivers and risks"""
+    profile = INDUSTRY_TABLE.get(industry.lower(), _DEFAULT_PROFILE)
+    growth_data = {
+        'growth_rates': {},
+        'industry_benchmarks': {},
+        'growth_drivers': [],
+        'risk_factors': []
+    }
+    
+    industry_rates = {'revenue': profile.revenue_growth, 'earnings': profile.earnings_growth, 'stage': profile.stage}
+    
+    # Build growth assumptions
+    growth_data['growth_rates'] = {
+        'year_1': industry_rates['revenue'] * 1.2,  # Above industry initially
+        'year_2': industry_rates['revenue'] * 1.1,
+        'year_3': industry_rates['revenue'],
+        'year_4': industry_rates['revenue'] * 0.9,
+        'year_5': industry_rates['revenue'] * 0.8,
+        'terminal_growth': 0.03  # GDP growth
+    }
+    
+    growth_data['industry_benchmarks'] = industry_rates
+    
+    growth_data['growth_drivers'] = list(profile.growth_drivers)
+    
+    growth_data['risk_factors'] = list(profile.risk_factors)
+    
+    return growth_data
+
+
+@lru_cache(maxsize=256)
+def _margins(industry: str) -> Dict[str, Any]:
+    """Industry-level margin averages, projections and drivers"""
+    profile = INDUSTRY_TABLE.get(industry.lower(), _DEFAULT_PROFILE)
+    margin_data = {
+        'margin_projections': {},
+        'industry_averages': {},
+        'margin_drivers': []
+    }
+    
+    margins = {'gross': profile.gross, 'operating': profile.operating, 'net': profile.net}
+    margin_data['industry_averages'] = margins
+    
+    # Project margins with mean reversion
+    current_year = margins['operating']
+    margin_data['margin_projections'] = {
+        'year_1': current_year * 1.05,  # Slight improvement
+        'year_2': current_year * 1.03,
+        'year_3': current_year * 1.01,
+        'year_4': current_year,
+        'year_5': current_year,
+        'terminal': current_year * 0.98  # Slight compression
+    }
+    
+    margin_data['margin_drivers'] = list(profile.margin_drivers)
+    
+    return margin_data
+
+
+@lru_cache(maxsize=256)
+def _capex(industry: str) -> Dict[str, Any]:
+    """Industry-level capex and working capital assumptions"""
+    profile = INDUSTRY_TABLE.get(industry.lower(), _DEFAULT_PROFILE)
+    capex_wc_data = {
+        'capex_assumptions': {},
+        'working_capital_assumptions': {},
+        'industry_benchmarks': {}
+    }
+    
+    capex_rate = profile.capex
+    wc_rate = profile.wc
+    
+    capex_wc_data['capex_assumptions'] = {
+        'maintenance_capex': capex_rate * 0.7,
+        'growth_capex': capex_rate * 0.3,
+        'total_capex_rate': capex_rate,
+        'depreciation_rate': capex_rate * 0.8  # Depreciation as % of capex
+    }
+    
+    capex_wc_data['working_capital_assumptions'] = {
+        'working_capital_pct': wc_rate,
+        'days_sales_outstanding': profile.days_sales_outstanding,
+        'days_inventory': profile.days_inventory,
+        'days_payable': 45
+    }
+    
+    capex_wc_data['industry_benchmarks'] = {
+        'capex_intensity': capex_rate,
+        'working_capital_intensity': wc_rate,
+        'asset_turnover': 1 / (capex_rate + wc_rate)
+    }
+    
+    return capex_wc_data
+
+
+@lru_cache(maxsize=256)
+def _multiples(industry: str) -> Dict[str, Any]:
+    """Industry valuation multiples and their drivers"""
+    profile = INDUSTRY_TABLE.get(industry.lower(), _DEFAULT_PROFILE)
+    multiples_data = {
+        'valuation_multiples': {},
+        'peer_universe': [],
+        'multiple_drivers': []
+    }
+    
+    multiples_data['valuation_multiples'] = {
+        'ev_revenue': profile.ev_rev,
+        'ev_ebitda': profile.ev_ebitda,
+        'pe': profile.pe,
+        **dict(profile.extra_multiples)
+    }
+    
+    multiples_data['multiple_drivers'] = list(profile.multiple_drivers)
+    
+    return multiples_data
+
 
 class IndustryAssumptionsEngine:
     """Engine for extracting and calculating industry-specific DCF model assumptions"""
     
     def __init__(self):
         self.session: Optional[aiohttp.ClientSession] = None
-        self.last_request_time = {}
+        self._domain_locks: Dict[str, asyncio.Lock] = {}
+        self._domain_last: Dict[str, float] = {}
+        self._http_cache: Dict[str, Tuple[float, bytes, Optional[str]]] = {}  # url -> (fetched_at, body, charset)
 
         # Initialize advanced components
         self.analysis_enhanced = True
@@ -58,19 +424,7 @@ class IndustryAssumptionsEngine:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
-
-    async def rate_limit(self, url: str):
-        """Implement rate limiting per domain"""
-        from urllib.parse import urlparse
-        domain = urlparse(url).netloc
         
-        if domain in self.last_request_time:
-            elapsed = time.time() - self.last_request_time[domain]
-            if elapsed < self.min_delay:
-                await asyncio.sleep(self.min_delay - elapsed)
-        
-        self.last_request_time[domain] = time.time()
-                
         # Industry-specific metrics mappings
         self.industry_metrics = {
             'technology': ['revenue_growth', 'r&d_expense', 'capex_ratio', 'gross_margin'],
@@ -84,57 +438,94 @@ class IndustryAssumptionsEngine:
             'utilities': ['rate_base_growth', 'allowed_roe', 'capex_plan', 'regulatory_lag'],
             'realestate': ['occupancy_rate', 'rent_growth', 'cap_rate', 'ffo_growth']
         }
+
+    async def rate_limit(self, url: str):
+        """Implement rate limiting per domain; concurrent requests to one host are spaced min_delay apart"""
+        domain = urlparse(url).netloc
+        lock = self._domain_locks.setdefault(domain, asyncio.Lock())
+        
+        async with lock:
+            if domain in self._domain_last:
+                elapsed = time.monotonic() - self._domain_last[domain]
+                if elapsed < self.min_delay:
+                    await asyncio.sleep(self.min_delay - elapsed)
+            
+            self._domain_last[domain] = time.monotonic()
     
     async def setup(self):
         """Setup aiohttp session"""
         if not self.session or self.session.closed:
-            self.session = aiohttp.ClientSession(headers=self.headers)
+            connector = aiohttp.TCPConnector(limit_per_host=4, keepalive_timeout=75, ttl_dns_cache=300)
+            self.session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
     
     async def cleanup(self):
         """Cleanup aiohttp session"""
         if self.session:
             await self.session.close()
     
+    @async_retry(max_attempts=3, delay=0.5)
+    async def _cached_get(self, url: str, ttl: float = 3600) -> Tuple[bytes, Optional[str]]:
+        """Raw page body and its declared charset from memory or the shared disk cache while younger than ttl,
+        otherwise a fresh GET"""
+        hit = self._http_cache.get(url)
+        if hit and time.time() - hit[0] < ttl:
+            return hit[1], hit[2]
+        
+        # sqlite + pickling a multi-hundred-KB body would block the event loop, so it runs in a thread
+        cached = await asyncio.to_thread(disk_cache.get_sync, 'industry_source_bytes', url)
+        if cached and time.time() - cached['fetched_at'] < ttl:
+            fetched_at, body, charset = cached['fetched_at'], cached['body'], cached['charset']
+        else:
+            await self.rate_limit(url)
+            async with self.session.get(url) as response:
+                # Error pages are neither parsed nor cached; 429/5xx are retried by async_retry
+                response.raise_for_status()
+                body, charset = await response.read(), response.charset
+            fetched_at = time.time()
+            await asyncio.to_thread(disk_cache.set_sync, 'industry_source_bytes', url, {
+                'body': body,
+                'charset': charset,
+                'fetched_at': fetched_at
+            }, None, timedelta(seconds=ttl))
+        
+        self._http_cache[url] = (fetched_at, body, charset)
+        return body, charset
+    
     async def scrape_industry_metrics(self, industry: str) -> Dict[str, Any]:
         """Scrape industry-specific metrics and benchmarks"""
         # Use Damodaran's data as primary source
         damodaran_url = "http://pages.stern.nyu.edu/~adamodar/New_Home_Page/datafile/margin.html"
         
         try:
-            async with self.session.get(damodaran_url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                industry_data = {
-                    'industry': industry,
-                    'source': 'damodaran_nyu',
-                    'metrics': {},
-                    'peer_averages': {},
-                    'historical_trends': {},
-                    'timestamp': datetime.now().isoformat()
+            rows = _industry_rows(*await self._cached_get(damodaran_url, ttl=DAMODARAN_TTL))
+            
+            industry_data = {
+                'industry': industry,
+                'source': 'damodaran_nyu',
+                'metrics': {},
+                'peer_averages': {},
+                'historical_trends': {},
+                'timestamp': _now_iso()
+            }
+            
+            # Find the industry's row in the prebuilt index of the page's data rows
+            industry_key = industry.lower()
+            cells = next((cells for name, cells in rows if industry_key in name), None)
+            # Extract metrics
+            if cells and len(cells) >= 6:
+                industry_data['metrics'] = {
+                    'gross_margin': cells[1],
+                    'operating_margin': cells[2],
+                    'net_margin': cells[3],
+                    'roe': cells[4],
+                    'roa': cells[5]
                 }
-                
-                # Find industry data in tables
-                tables = soup.find_all('table')
-                for table in tables:
-                    rows = table.find_all('tr')
-                    for row in rows:
-                        cells = row.find_all('td')
-                        if cells and len(cells) > 1:
-                            industry_name = cells[0].text.strip().lower()
-                            if industry.lower() in industry_name:
-                                # Extract metrics
-                                if len(cells) >= 6:
-                                    industry_data['metrics'] = {
-                                        'gross_margin': cells[1].text.strip(),
-                                        'operating_margin': cells[2].text.strip(),
-                                        'net_margin': cells[3].text.strip(),
-                                        'roe': cells[4].text.strip(),
-                                        'roa': cells[5].text.strip()
-                                    }
-                                break
-                
-                return industry_data
+            
+            return industry_data
         
         except Exception as e:
             return {'error': f"Failed to scrape industry metrics: {str(e)}"}
@@ -153,65 +544,32 @@ class IndustryAssumptionsEngine:
         treasury_url = "https://www.treasury.gov/resource-center/data-chart-center/interest-rates/pages/textview.aspx?data=yield"
         
         try:
-            async with self.session.get(treasury_url) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Find 10-year treasury yield
-                table = soup.find('table', {'class': 't-chart'})
-                if table:
-                    rows = table.find_all('tr')
-                    for row in rows[-1:]:  # Get most recent
-                        cells = row.find_all('td')
-                        if len(cells) >= 10:
-                            wacc_data['components']['risk_free_rate'] = cells[9].text.strip()  # 10-year column
+            tree = _html_tree(*await self._cached_get(treasury_url, ttl=TREASURY_TTL))
+            
+            # Find 10-year treasury yield in the most recent row of the yield table
+            rows = tree.xpath(_LATEST_YIELD_ROW_XPATH) if tree is not None else []
+            if rows:
+                cells = rows[0].xpath('.//td')
+                if len(cells) >= 10:
+                    wacc_data['components']['risk_free_rate'] = cells[9].text_content().strip()  # 10-year column
         except:
             wacc_data['components']['risk_free_rate'] = '4.5%'  # Default
         
         # Get industry-specific metrics
-        industry_betas = {
-            'technology': 1.25,
-            'retail': 1.10,
-            'finance': 1.15,
-            'healthcare': 0.95,
-            'energy': 1.20,
-            'industrial': 1.05,
-            'consumer': 0.90,
-            'telecom': 0.85,
-            'utilities': 0.65,
-            'realestate': 0.75
-        }
-        
-        wacc_data['components']['beta'] = industry_betas.get(industry.lower(), 1.0)
+        profile = INDUSTRY_TABLE.get(industry.lower(), _DEFAULT_PROFILE)
+        wacc_data['components']['beta'] = profile.beta
         wacc_data['components']['market_risk_premium'] = 0.065  # Historical average
         
         # Handle risk-free rate safely
         risk_free_str = wacc_data['components'].get('risk_free_rate', '4.5%')
-        try:
-            risk_free_rate = float(risk_free_str.strip('%')) / 100
-        except:
-            risk_free_rate = 0.045  # Default 4.5%
+        risk_free_rate = _pct(risk_free_str, 0.045)  # Default 4.5%
         
         wacc_data['components']['cost_of_equity'] = (
             risk_free_rate +
             wacc_data['components']['beta'] * wacc_data['components']['market_risk_premium']
         )
         
-        # Industry debt ratios
-        industry_debt_ratios = {
-            'technology': 0.20,
-            'retail': 0.35,
-            'finance': 0.70,
-            'healthcare': 0.25,
-            'energy': 0.40,
-            'industrial': 0.30,
-            'consumer': 0.35,
-            'telecom': 0.50,
-            'utilities': 0.60,
-            'realestate': 0.55
-        }
-        
-        debt_ratio = industry_debt_ratios.get(industry.lower(), 0.30)
+        debt_ratio = profile.debt_ratio
         wacc_data['components']['debt_to_equity'] = debt_ratio / (1 - debt_ratio)
         wacc_data['components']['cost_of_debt'] = 0.04  # Approximate
         wacc_data['components']['tax_rate'] = 0.21  # US corporate tax rate
@@ -229,210 +587,30 @@ class IndustryAssumptionsEngine:
         
         return wacc_data
     
-    async def get_growth_assumptions(self, ticker: str, industry: str) -> Dict[str, Any]:
+    def get_growth_assumptions(self, ticker: str, industry: str) -> Dict[str, Any]:
         """Get revenue and earnings growth assumptions based on industry data"""
-        growth_data = {
-            'ticker': ticker,
-            'industry': industry,
-            'growth_rates': {},
-            'industry_benchmarks': {},
-            'growth_drivers': [],
-            'risk_factors': []
-        }
-        
-        # Industry growth rates
-        industry_growth = {
-            'technology': {'revenue': 0.15, 'earnings': 0.18, 'stage': 'growth'},
-            'retail': {'revenue': 0.05, 'earnings': 0.06, 'stage': 'mature'},
-            'finance': {'revenue': 0.06, 'earnings': 0.08, 'stage': 'mature'},
-            'healthcare': {'revenue': 0.08, 'earnings': 0.10, 'stage': 'growth'},
-            'energy': {'revenue': 0.04, 'earnings': 0.05, 'stage': 'cyclical'},
-            'industrial': {'revenue': 0.06, 'earnings': 0.07, 'stage': 'mature'},
-            'consumer': {'revenue': 0.04, 'earnings': 0.05, 'stage': 'mature'},
-            'telecom': {'revenue': 0.03, 'earnings': 0.04, 'stage': 'mature'},
-            'utilities': {'revenue': 0.03, 'earnings': 0.03, 'stage': 'stable'},
-            'realestate': {'revenue': 0.05, 'earnings': 0.06, 'stage': 'cyclical'}
-        }
-        
-        industry_rates = industry_growth.get(industry.lower(), {'revenue': 0.05, 'earnings': 0.06, 'stage': 'mature'})
-        
-        # Build growth assumptions
-        growth_data['growth_rates'] = {
-            'year_1': industry_rates['revenue'] * 1.2,  # Above industry initially
-            'year_2': industry_rates['revenue'] * 1.1,
-            'year_3': industry_rates['revenue'],
-            'year_4': industry_rates['revenue'] * 0.9,
-            'year_5': industry_rates['revenue'] * 0.8,
-            'terminal_growth': 0.03  # GDP growth
-        }
-        
-        growth_data['industry_benchmarks'] = industry_rates
-        
-        # Industry-specific growth drivers
-        growth_drivers_map = {
-            'technology': ['Cloud adoption', 'AI/ML integration', 'Digital transformation', 'SaaS conversion'],
-            'retail': ['E-commerce growth', 'Omnichannel strategy', 'Market expansion', 'Customer loyalty'],
-            'finance': ['Interest rate environment', 'Loan growth', 'Fee income', 'Digital banking'],
-            'healthcare': ['Aging population', 'Drug pipeline', 'Market access', 'Pricing power'],
-            'energy': ['Commodity prices', 'Production volumes', 'Reserve additions', 'Cost efficiency'],
-            'industrial': ['Economic cycles', 'Infrastructure spending', 'Automation', 'Supply chain'],
-            'consumer': ['Brand strength', 'Market share', 'Innovation', 'Demographics'],
-            'telecom': ['5G rollout', 'Subscriber growth', 'ARPU trends', 'Network investment'],
-            'utilities': ['Rate base growth', 'Regulatory support', 'Renewable transition', 'Efficiency'],
-            'realestate': ['Occupancy trends', 'Rent growth', 'Development pipeline', 'Location quality']
-        }
-        
-        growth_data['growth_drivers'] = growth_drivers_map.get(industry.lower(), ['Market growth', 'Operational efficiency'])
-        
-        # Industry-specific risk factors
-        risk_factors_map = {
-            'technology': ['Competition', 'Technology obsolescence', 'Regulatory changes', 'Cybersecurity'],
-            'retail': ['Consumer spending', 'E-commerce disruption', 'Inventory management', 'Labor costs'],
-            'finance': ['Credit risk', 'Interest rate risk', 'Regulatory changes', 'Economic cycles'],
-            'healthcare': ['Regulatory approval', 'Pricing pressure', 'Patent expiration', 'R&D risk'],
-            'energy': ['Commodity volatility', 'Environmental regulation', 'Geopolitical risk', 'Transition risk'],
-            'industrial': ['Economic cycles', 'Raw material costs', 'Trade policies', 'Labor availability'],
-            'consumer': ['Consumer preferences', 'Input costs', 'Brand relevance', 'Distribution'],
-            'telecom': ['Competition', 'Capex requirements', 'Technology shifts', 'Regulation'],
-            'utilities': ['Regulatory risk', 'Weather', 'Fuel costs', 'Infrastructure age'],
-            'realestate': ['Interest rates', 'Economic cycles', 'Location risk', 'Construction costs']
-        }
-        
-        growth_data['risk_factors'] = risk_factors_map.get(industry.lower(), ['Market risk', 'Operational risk'])
-        
-        return growth_data
+        return {'ticker': ticker, 'industry': industry, **_growth(industry)}
     
-    async def get_margin_assumptions(self, ticker: str, industry: str) -> Dict[str, Any]:
+    def get_margin_assumptions(self, ticker: str, industry: str) -> Dict[str, Any]:
         """Get operating margin and profitability assumptions"""
-        margin_data = {
-            'ticker': ticker,
-            'industry': industry,
-            'margin_projections': {},
-            'industry_averages': {},
-            'margin_drivers': []
-        }
-        
-        # Industry margin profiles
-        industry_margins = {
-            'technology': {'gross': 0.65, 'operating': 0.25, 'net': 0.20},
-            'retail': {'gross': 0.35, 'operating': 0.08, 'net': 0.05},
-            'finance': {'gross': 0.90, 'operating': 0.40, 'net': 0.25},
-            'healthcare': {'gross': 0.70, 'operating': 0.20, 'net': 0.15},
-            'energy': {'gross': 0.30, 'operating': 0.15, 'net': 0.10},
-            'industrial': {'gross': 0.30, 'operating': 0.12, 'net': 0.08},
-            'consumer': {'gross': 0.40, 'operating': 0.15, 'net': 0.10},
-            'telecom': {'gross': 0.60, 'operating': 0.20, 'net': 0.12},
-            'utilities': {'gross': 0.40, 'operating': 0.20, 'net': 0.12},
-            'realestate': {'gross': 0.70, 'operating': 0.35, 'net': 0.20}
-        }
-        
-        margins = industry_margins.get(industry.lower(), {'gross': 0.40, 'operating': 0.15, 'net': 0.10})
-        margin_data['industry_averages'] = margins
-        
-        # Project margins with mean reversion
-        current_year = margins['operating']
-        margin_data['margin_projections'] = {
-            'year_1': current_year * 1.05,  # Slight improvement
-            'year_2': current_year * 1.03,
-            'year_3': current_year * 1.01,
-            'year_4': current_year,
-            'year_5': current_year,
-            'terminal': current_year * 0.98  # Slight compression
-        }
-        
-        # Margin drivers by industry
-        margin_drivers_map = {
-            'technology': ['Scale economies', 'R&D leverage', 'Pricing power', 'Automation'],
-            'retail': ['Supply chain efficiency', 'Private label', 'Store optimization', 'Digital sales'],
-            'finance': ['Net interest margin', 'Fee income', 'Operating leverage', 'Credit quality'],
-            'healthcare': ['Drug mix', 'Pricing', 'R&D efficiency', 'Manufacturing scale'],
-            'energy': ['Commodity prices', 'Production efficiency', 'Cost discipline', 'Technology'],
-            'industrial': ['Capacity utilization', 'Pricing', 'Productivity', 'Mix shift'],
-            'consumer': ['Brand premium', 'Cost control', 'Distribution efficiency', 'Product mix'],
-            'telecom': ['Network efficiency', 'Customer mix', 'Cost per subscriber', 'Pricing'],
-            'utilities': ['Rate recovery', 'Operating efficiency', 'Fuel costs', 'Maintenance'],
-            'realestate': ['Occupancy', 'Rental rates', 'Operating leverage', 'Property quality']
-        }
-        
-        margin_data['margin_drivers'] = margin_drivers_map.get(industry.lower(), ['Efficiency', 'Scale', 'Pricing'])
-        
-        return margin_data
+        return {'ticker': ticker, 'industry': industry, **_margins(industry)}
     
-    async def get_capex_working_capital(self, ticker: str, industry: str) -> Dict[str, Any]:
+    def get_capex_working_capital(self, ticker: str, industry: str) -> Dict[str, Any]:
         """Get capital expenditure and working capital assumptions"""
-        capex_wc_data = {
-            'ticker': ticker,
-            'industry': industry,
-            'capex_assumptions': {},
-            'working_capital_assumptions': {},
-            'industry_benchmarks': {}
-        }
-        
-        # Industry capex intensity
-        industry_capex = {
-            'technology': 0.05,  # % of revenue
-            'retail': 0.03,
-            'finance': 0.02,
-            'healthcare': 0.04,
-            'energy': 0.15,
-            'industrial': 0.04,
-            'consumer': 0.03,
-            'telecom': 0.15,
-            'utilities': 0.20,
-            'realestate': 0.02
-        }
-        
-        # Working capital as % of revenue
-        industry_wc = {
-            'technology': 0.10,
-            'retail': 0.15,
-            'finance': 0.05,
-            'healthcare': 0.20,
-            'energy': 0.10,
-            'industrial': 0.15,
-            'consumer': 0.12,
-            'telecom': 0.08,
-            'utilities': 0.10,
-            'realestate': 0.05
-        }
-        
-        capex_rate = industry_capex.get(industry.lower(), 0.05)
-        wc_rate = industry_wc.get(industry.lower(), 0.10)
-        
-        capex_wc_data['capex_assumptions'] = {
-            'maintenance_capex': capex_rate * 0.7,
-            'growth_capex': capex_rate * 0.3,
-            'total_capex_rate': capex_rate,
-            'depreciation_rate': capex_rate * 0.8  # Depreciation as % of capex
-        }
-        
-        capex_wc_data['working_capital_assumptions'] = {
-            'working_capital_pct': wc_rate,
-            'days_sales_outstanding': 45 if industry.lower() != 'retail' else 5,
-            'days_inventory': 60 if industry.lower() in ['retail', 'industrial', 'consumer'] else 30,
-            'days_payable': 45
-        }
-        
-        capex_wc_data['industry_benchmarks'] = {
-            'capex_intensity': capex_rate,
-            'working_capital_intensity': wc_rate,
-            'asset_turnover': 1 / (capex_rate + wc_rate)
-        }
-        
-        return capex_wc_data
+        return {'ticker': ticker, 'industry': industry, **_capex(industry)}
     
     async def generate_dcf_assumptions(self, ticker: str, industry: str) -> Dict[str, Any]:
         """Generate comprehensive DCF model assumptions"""
-        # Gather all components
+        # Only the WACC scrape does I/O; the rest are table lookups
         wacc = await self.calculate_wacc_components(ticker, industry)
-        growth = await self.get_growth_assumptions(ticker, industry)
-        margins = await self.get_margin_assumptions(ticker, industry)
-        capex_wc = await self.get_capex_working_capital(ticker, industry)
+        growth = self.get_growth_assumptions(ticker, industry)
+        margins = self.get_margin_assumptions(ticker, industry)
+        capex_wc = self.get_capex_working_capital(ticker, industry)
         
         dcf_assumptions = {
             'ticker': ticker,
             'industry': industry,
-            'generated_date': datetime.now().isoformat(),
+            'generated_date': _now_iso(),
             'valuation_assumptions': {
                 'wacc': wacc['calculated_wacc'],
                 'terminal_growth_rate': growth['growth_rates']['terminal_growth'],
@@ -465,54 +643,45 @@ class IndustryAssumptionsEngine:
         
         return dcf_assumptions
     
-    async def get_comparable_multiples(self, industry: str) -> Dict[str, Any]:
+    def get_comparable_multiples(self, industry: str) -> Dict[str, Any]:
         """Get industry-specific valuation multiples"""
-        multiples_data = {
-            'industry': industry,
-            'valuation_multiples': {},
-            'peer_universe': [],
-            'multiple_drivers': []
-        }
+        return {'industry': industry, **_multiples(industry)}
+    
+    async def get_industry_overview(self, industry: str) -> Dict[str, Any]:
+        """Combine scraped metrics, multiples and typical assumptions for an industry"""
+        # Comprehensive industry analysis
+        metrics = await self.scrape_industry_metrics(industry)
+        multiples = self.get_comparable_multiples(industry)
         
-        # Industry multiple ranges
-        industry_multiples = {
-            'technology': {'ev_revenue': 5.0, 'ev_ebitda': 20.0, 'pe': 25.0},
-            'retail': {'ev_revenue': 0.8, 'ev_ebitda': 10.0, 'pe': 18.0},
-            'finance': {'ev_revenue': 3.0, 'ev_ebitda': 12.0, 'pe': 15.0, 'p_book': 1.5},
-            'healthcare': {'ev_revenue': 3.5, 'ev_ebitda': 15.0, 'pe': 20.0},
-            'energy': {'ev_revenue': 1.5, 'ev_ebitda': 8.0, 'pe': 12.0},
-            'industrial': {'ev_revenue': 1.5, 'ev_ebitda': 12.0, 'pe': 18.0},
-            'consumer': {'ev_revenue': 2.0, 'ev_ebitda': 12.0, 'pe': 20.0},
-            'telecom': {'ev_revenue': 2.0, 'ev_ebitda': 8.0, 'pe': 15.0},
-            'utilities': {'ev_revenue': 2.5, 'ev_ebitda': 10.0, 'pe': 18.0},
-            'realestate': {'ev_revenue': 5.0, 'ev_ebitda': 18.0, 'pe': 20.0, 'p_ffo': 15.0}
-        }
+        # Sample company for assumptions
+        sample_ticker = INDUSTRY_TABLE.get(industry, _DEFAULT_PROFILE).sample_ticker
         
-        multiples_data['valuation_multiples'] = industry_multiples.get(
-            industry.lower(), 
-            {'ev_revenue': 2.0, 'ev_ebitda': 12.0, 'pe': 18.0}
-        )
+        growth = self.get_growth_assumptions(sample_ticker, industry)
+        margins = self.get_margin_assumptions(sample_ticker, industry)
+        capital = self.get_capex_working_capital(sample_ticker, industry)
         
-        # Multiple drivers by industry
-        multiple_drivers_map = {
-            'technology': ['Growth rate', 'Recurring revenue %', 'Market position', 'Profitability'],
-            'retail': ['Same-store sales', 'E-commerce mix', 'Market share', 'Margins'],
-            'finance': ['ROE', 'Asset quality', 'Capital ratios', 'Growth'],
-            'healthcare': ['Pipeline', 'Patent life', 'Market size', 'Margins'],
-            'energy': ['Reserve life', 'Production growth', 'Cost position', 'Commodity exposure'],
-            'industrial': ['Cycle position', 'Market share', 'Margins', 'Growth'],
-            'consumer': ['Brand strength', 'Growth', 'Margins', 'Market position'],
-            'telecom': ['Subscriber growth', 'ARPU', 'Market share', 'Network quality'],
-            'utilities': ['Rate base growth', 'Regulatory environment', 'Renewable mix', 'Dividend yield'],
-            'realestate': ['Location quality', 'Occupancy', 'Rent growth', 'Development pipeline']
+        return {
+            'industry': industry,
+            'metrics_overview': metrics,
+            'valuation_framework': multiples,
+            'typical_assumptions': {
+                'growth_profile': growth['growth_rates'],
+                'margin_profile': margins['industry_averages'],
+                'capital_intensity': capital['industry_benchmarks']
+            },
+            'key_characteristics': {
+                'industry_stage': growth['industry_benchmarks']['stage'],
+                'growth_drivers': growth['growth_drivers'],
+                'risk_factors': growth['risk_factors'],
+                'margin_drivers': margins['margin_drivers'],
+                'valuation_drivers': multiples['multiple_drivers']
+            },
+            'dcf_guidelines': {
+                'recommended_projection_period': 5,
+                'terminal_growth_rate': growth['growth_rates']['terminal_growth'],
+                'key_sensitivities': ['WACC', 'Terminal Growth', 'Operating Margin']
+            }
         }
-        
-        multiples_data['multiple_drivers'] = multiple_drivers_map.get(
-            industry.lower(), 
-            ['Growth', 'Profitability', 'Market position', 'Risk profile']
-        )
-        
-        return multiples_data
 
 
 # Initialize server
@@ -643,155 +812,78 @@ async def list_tools() -> List[Tool]:
         )
     ]
 
+# Tool name -> engine coroutine; ticker-scoped tools take (ticker, industry), the rest just (industry)
+TICKER_TOOLS = {
+    "calculate_wacc": engine.calculate_wacc_components,
+    "get_growth_assumptions": engine.get_growth_assumptions,
+    "get_margin_assumptions": engine.get_margin_assumptions,
+    "get_capital_assumptions": engine.get_capex_working_capital,
+    "generate_full_dcf_assumptions": engine.generate_dcf_assumptions
+}
+INDUSTRY_TOOLS = {
+    "get_valuation_multiples": engine.get_comparable_multiples,
+    "get_industry_metrics": engine.get_industry_overview
+}
+
+# Tools whose output is a pure function of their arguments; their rendered JSON is kept (LRU) and reused.
+# Scrape-backed tools are re-rendered each call so a fallback value is never pinned in the cache.
+PURE_TOOLS = {"get_growth_assumptions", "get_margin_assumptions", "get_capital_assumptions", "get_valuation_multiples"}
+RENDER_CACHE_SIZE = 512
+_rendered: "OrderedDict[Tuple[str, ...], str]" = OrderedDict()
+
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> List[TextContent]:
-    await engine.setup()
-    
     try:
-        if name == "calculate_wacc":
-            ticker = arguments["ticker"].upper()
-            industry = arguments["industry"].lower()
-            
-            wacc_data = await engine.calculate_wacc_components(ticker, industry)
-            
-            return [TextContent(
-                type="text",
-                text=json.dumps(wacc_data, indent=2)
-            )]
-        
-        elif name == "get_growth_assumptions":
-            ticker = arguments["ticker"].upper()
-            industry = arguments["industry"].lower()
-            
-            growth_data = await engine.get_growth_assumptions(ticker, industry)
-            
-            return [TextContent(
-                type="text",
-                text=json.dumps(growth_data, indent=2)
-            )]
-        
-        elif name == "get_margin_assumptions":
-            ticker = arguments["ticker"].upper()
-            industry = arguments["industry"].lower()
-            
-            margin_data = await engine.get_margin_assumptions(ticker, industry)
-            
-            return [TextContent(
-                type="text",
-                text=json.dumps(margin_data, indent=2)
-            )]
-        
-        elif name == "get_capital_assumptions":
-            ticker = arguments["ticker"].upper()
-            industry = arguments["industry"].lower()
-            
-            capital_data = await engine.get_capex_working_capital(ticker, industry)
-            
-            return [TextContent(
-                type="text",
-                text=json.dumps(capital_data, indent=2)
-            )]
-        
-        elif name == "generate_full_dcf_assumptions":
-            ticker = arguments["ticker"].upper()
-            industry = arguments["industry"].lower()
-            
-            dcf_assumptions = await engine.generate_dcf_assumptions(ticker, industry)
-            
-            return [TextContent(
-                type="text",
-                text=json.dumps(dcf_assumptions, indent=2)
-            )]
-        
-        elif name == "get_valuation_multiples":
-            industry = arguments["industry"].lower()
-            
-            multiples_data = await engine.get_comparable_multiples(industry)
-            
-            return [TextContent(
-                type="text",
-                text=json.dumps(multiples_data, indent=2)
-            )]
-        
-        elif name == "get_industry_metrics":
-            industry = arguments["industry"].lower()
-            
-            # Comprehensive industry analysis
-            metrics = await engine.scrape_industry_metrics(industry)
-            multiples = await engine.get_comparable_multiples(industry)
-            
-            # Sample company for assumptions
-            sample_ticker = {
-                'technology': 'MSFT',
-                'retail': 'WMT',
-                'finance': 'JPM',
-                'healthcare': 'JNJ',
-                'energy': 'XOM',
-                'industrial': 'CAT',
-                'consumer': 'PG',
-                'telecom': 'VZ',
-                'utilities': 'NEE',
-                'realestate': 'SPG'
-            }.get(industry, 'SPY')
-            
-            growth = await engine.get_growth_assumptions(sample_ticker, industry)
-            margins = await engine.get_margin_assumptions(sample_ticker, industry)
-            capital = await engine.get_capex_working_capital(sample_ticker, industry)
-            
-            comprehensive_data = {
-                'industry': industry,
-                'metrics_overview': metrics,
-                'valuation_framework': multiples,
-                'typical_assumptions': {
-                    'growth_profile': growth['growth_rates'],
-                    'margin_profile': margins['industry_averages'],
-                    'capital_intensity': capital['industry_benchmarks']
-                },
-                'key_characteristics': {
-                    'industry_stage': growth['industry_benchmarks']['stage'],
-                    'growth_drivers': growth['growth_drivers'],
-                    'risk_factors': growth['risk_factors'],
-                    'margin_drivers': margins['margin_drivers'],
-                    'valuation_drivers': multiples['multiple_drivers']
-                },
-                'dcf_guidelines': {
-                    'recommended_projection_period': 5,
-                    'terminal_growth_rate': growth['growth_rates']['terminal_growth'],
-                    'key_sensitivities': ['WACC', 'Terminal Growth', 'Operating Margin']
-                }
-            }
-            
-            return [TextContent(
-                type="text",
-                text=json.dumps(comprehensive_data, indent=2)
-            )]
-        
+        if name in TICKER_TOOLS:
+            tool, args = TICKER_TOOLS[name], (arguments["ticker"].upper(), arguments["industry"].lower())
+        elif name in INDUSTRY_TOOLS:
+            tool, args = INDUSTRY_TOOLS[name], (arguments["industry"].lower(),)
         else:
             return [TextContent(
                 type="text",
                 text=f"Unknown tool: {name}"
             )]
+        
+        key = (name, *args)
+        text = _rendered.get(key)
+        if text is None:
+            # Pure tools are plain synchronous lookups; only the scrape-backed ones are coroutines
+            data = tool(*args) if name in PURE_TOOLS else await tool(*args)
+            text = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+            if name in PURE_TOOLS:
+                _rendered[key] = text
+                if len(_rendered) > RENDER_CACHE_SIZE:
+                    _rendered.popitem(last=False)
+        else:
+            _rendered.move_to_end(key)
+        
+        return [TextContent(
+            type="text",
+            text=text
+        )]
     
     except Exception as e:
         return [TextContent(
             type="text",
-            text=json.dumps({"error": str(e)}, indent=2)
+            text=orjson.dumps({"error": str(e)}, option=orjson.OPT_INDENT_2).decode()
         )]
-    
-    finally:
-        await engine.cleanup()
 
 async def main():
-    async with stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="industry-assumptions-engine",
-                server_version="0.1.0",
-                capabilities={}
+    # One pooled session for the server's lifetime keeps connections to Damodaran and Treasury alive between calls
+    await engine.setup()
+    try:
+        async with stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="industry-assumptions-engine",
+                    server_version="0.1.0",
+                    capabilities={}
+                )
             )
-        )
+    finally:
+        await engine.cleanup()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -3,20 +3,23 @@ import time
 
 import json
 import asyncio
+import math
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 import re
-from urllib.parse import quote
+from urllib.parse import quote, urlparse
 
 import aiohttp
-from bs4 import BeautifulSoup
+import lxml.html
+from bs4 import BeautifulSoup, SoupStrainer
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.types import Tool, TextContent
 import mcp.server.stdio as stdio
 
 import asyncio
-from functools import wraps
+from functools import lru_cache, wraps
 
 # Import advanced modules
 import sys
@@ -24,6 +27,80 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent / "shared"))
 
 
+# BeautifulSoup tree builder; 'html.parser' works where libxml2 is unavailable
+PARSER = 'lxml'
+
+
+def _class_xpath(tag: str, class_name: str) -> str:
+    """XPath selecting tag elements whose class attribute contains the given token"""
+    return f"//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+@lru_cache(maxsize=8)
+def _html_parser(encoding: Optional[str]) -> lxml.html.HTMLParser:
+    """One reusable HTML parser per response encoding"""
+    return lxml.html.HTMLParser(encoding=encoding)
+
+
+def _html_tree(body: bytes, charset: Optional[str] = None):
+    """lxml tree parsed straight from the response bytes (no str decode); an empty body yields an empty document.
+    
+    Without an HTTP charset lxml falls back to the page's own meta declaration.
+    """
+    if not body.strip():
+        return lxml.html.Element('html')
+    return lxml.html.fromstring(body, parser=_html_parser(charset))
+
+
+def _cell_texts(row) -> List[str]:
+    """Stripped text of every <td> under an lxml table row"""
+    return [td.text_content().strip() for td in row.iterdescendants('td')]
+
+
+# Page TTLs in seconds, matched to how often each source actually changes
+FINVIZ_TTL = 900
+NASDAQ_TTL = 24 * 3600
+OPENINSIDER_TTL = 3600
+WHALEWISDOM_TTL = 24 * 3600
+SEC_INDEX_TTL = 24 * 3600
+SEC_FILING_TTL = math.inf  # archived filings never change once posted
+# Page bodies kept in memory; least recently used pages are evicted first, however long their TTL
+PAGE_CACHE_SIZE = 256
+
+# The hottest pages (Finviz snapshot, OpenInsider search) are read straight off an lxml tree
+_FINVIZ_SNAPSHOT_XPATH = _class_xpath('table', 'snapshot-table')
+_FINVIZ_RATINGS_XPATH = _class_xpath('table', 'ratings-outer')
+_OPENINSIDER_XPATH = _class_xpath('table', 'tinytable')
+_OPENINSIDER_ROWS_XPATH = '(.//tr)[position() > 1 and position() <= 21]'  # Skip header, recent 20 transactions
+_OPENINSIDER_FIELDS = (
+    'filing_date', 'trade_date', 'ticker', 'insider_name', 'title',
+    'trade_type', 'price', 'quantity', 'owned', 'value'
+)
+_INT_RE = re.compile(r'[-+]?\d+')
+
+# Finviz snapshot label fragments -> ownership keys, tried in order ('Shs Float' lands on 'float')
+_OWNERSHIP_LABELS = {
+    'Inst Own': 'institutional',
+    'Insider Own': 'insider',
+    'Float': 'float',
+    'Shares Outstanding': 'shares_outstanding'
+}
+
+# EDGAR filings index: the tableFile-classed table, else the one summarised as a Document list
+_SEC_TABLE_FILE_XPATH = "//table[contains(@class, 'tableFile')]"
+_SEC_DOCUMENT_XPATH = "//table[contains(@summary, 'Document')]"
+_RE_INFO_TABLE = re.compile('INFORMATION TABLE', re.I)
+
+# Only the tables/links the remaining scrapers read get materialized
+_TABLE_STRAINER = SoupStrainer('table')
+_WHALEWISDOM_STRAINER = SoupStrainer('table', id='current_holdings_table')
+
+
+async def gather_sources(*coros) -> List[Any]:
+    """Run independent source scrapes concurrently, turning raised exceptions into error payloads"""
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    return [{'error': str(result)} if isinstance(result, Exception) else result for result in results]
+
 
 def async_retry(max_attempts=3, delay=1):
     """Retry decorator for async functions"""
@@ -45,95 +122,175 @@ def async_retry(max_attempts=3, delay=1):
 
 
 
+class CachedPage(NamedTuple):
+    """A fetched page body plus the validators needed to revalidate it once its TTL lapses"""
+    expires_at: float
+    body: bytes
+    charset: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class TokenBucket:
+    """Per-domain request budget: refills at rate tokens per second and holds at most capacity"""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Take one token, sleeping only as long as the refill needs"""
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            if self.tokens < 1:
+                # Waiters queue on the lock, so each one is spaced 1/rate after the previous
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 1
+                self.last_refill = time.monotonic()
+            self.tokens -= 1
+
+
 class InstitutionalScraper:
     """Scraper for institutional holdings and insider trading data from free sources"""
     
     def __init__(self):
         self.session: Optional[aiohttp.ClientSession] = None
-        self.last_request_time = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._page_cache: "OrderedDict[str, CachedPage]" = OrderedDict()
+        # Caps in-flight page fetches across all tools; the connector caps each host at 4
+        self._fetch_sem = asyncio.Semaphore(10)
 
         # Initialize advanced components
         self.analysis_enhanced = True
-        self.min_delay = 1.0  # Rate limiting
+        self.requests_per_second = 1.0  # Per-domain rate limit
+        self.burst = 2  # Requests an idle domain may take back to back
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            # Finviz/NASDAQ/SEC all compress HTML; aiohttp inflates it (br via the brotli dependency)
+            'Accept-Encoding': 'gzip, deflate, br'
         }
         self.sec_headers = {
             'User-Agent': 'FinancialMCP/1.0 (Personal Research Tool; Contact: research@example.com)',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Encoding': 'gzip, deflate, br'
         }
 
     async def rate_limit(self, url: str):
         """Implement rate limiting per domain"""
-        from urllib.parse import urlparse
         domain = urlparse(url).netloc
-        
-        if domain in self.last_request_time:
-            elapsed = time.time() - self.last_request_time[domain]
-            if elapsed < self.min_delay:
-                await asyncio.sleep(self.min_delay - elapsed)
-        
-        self.last_request_time[domain] = time.time()
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            bucket = self._buckets[domain] = TokenBucket(self.requests_per_second, self.burst)
+        await bucket.acquire()
     
     async def setup(self):
         """Setup aiohttp session"""
         if not self.session or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(limit=50, limit_per_host=4, ttl_dns_cache=300, keepalive_timeout=60)
+            self.session = aiohttp.ClientSession(connector=connector)
     
     async def cleanup(self):
         """Cleanup aiohttp session"""
         if self.session:
             await self.session.close()
     
+    async def fetch_page(self, url: str, ttl: float, headers: Dict[str, str]) -> Tuple[bytes, Optional[str]]:
+        """Raw page body and its declared charset, served from memory while younger than ttl seconds.
+        
+        A stale copy is revalidated with a conditional GET, so an unchanged page comes back as a bodiless 304.
+        """
+        cached = self._page_cache.get(url)
+        if cached:
+            if cached.expires_at > time.monotonic():
+                self._page_cache.move_to_end(url)
+                return cached.body, cached.charset
+            if not (cached.etag or cached.last_modified):
+                # Nothing to revalidate against, so the expired body is dead weight
+                del self._page_cache[url]
+                cached = None
+        
+        if cached and (cached.etag or cached.last_modified):
+            headers = dict(headers)
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+        
+        await self.rate_limit(url)
+        try:
+            async with self._fetch_sem, self.session.get(url, headers=headers) as response:
+                if response.status == 304 and cached:
+                    self._store_page(url, cached._replace(expires_at=time.monotonic() + ttl))
+                    return cached.body, cached.charset
+                if response.status != 200 and cached:
+                    # Throttled or failing upstream: the last good copy beats parsing an error page
+                    return cached.body, cached.charset
+                
+                body, charset = await response.read(), response.charset
+                # Only successful pages are cached so an error page is retried next call
+                if response.status == 200:
+                    self._store_page(url, CachedPage(
+                        time.monotonic() + ttl, body, charset,
+                        response.headers.get('ETag'), response.headers.get('Last-Modified')
+                    ))
+                return body, charset
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # Timeouts and connection failures fall back to the last good copy as well
+            if cached:
+                return cached.body, cached.charset
+            raise
+    
+    def _store_page(self, url: str, page: CachedPage):
+        """Insert or refresh a cached page as most recently used, evicting past PAGE_CACHE_SIZE"""
+        self._page_cache[url] = page
+        self._page_cache.move_to_end(url)
+        while len(self._page_cache) > PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+    
     async def scrape_finviz_institutional(self, ticker: str) -> Dict[str, Any]:
         """Scrape institutional ownership from Finviz"""
         url = f"https://finviz.com/quote.ashx?t={ticker}"
         
         try:
-            async with self.session.get(url, headers=self.headers) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                institutional_data = {
-                    'ticker': ticker,
-                    'source': 'finviz',
-                    'ownership': {},
-                    'recent_transactions': []
-                }
-                
-                # Get ownership percentages from snapshot table
-                snapshot_table = soup.find('table', {'class': 'snapshot-table'})
-                if snapshot_table:
-                    for row in snapshot_table.find_all('tr'):
-                        cells = row.find_all('td')
-                        for i in range(0, len(cells), 2):
-                            if i + 1 < len(cells):
-                                label = cells[i].text.strip()
-                                value = cells[i + 1].text.strip()
-                                
-                                if 'Inst Own' in label:
-                                    institutional_data['ownership']['institutional'] = value
-                                elif 'Insider Own' in label:
-                                    institutional_data['ownership']['insider'] = value
-                                elif 'Float' in label:
-                                    institutional_data['ownership']['float'] = value
-                                elif 'Shares Outstanding' in label:
-                                    institutional_data['ownership']['shares_outstanding'] = value
-                
-                # Get recent institutional transactions
-                inst_table = soup.find('table', {'class': 'ratings-outer'})
-                if inst_table:
-                    for row in inst_table.find_all('tr')[1:]:  # Skip header
-                        cells = row.find_all('td')
-                        if len(cells) >= 4:
-                            institutional_data['recent_transactions'].append({
-                                'date': cells[0].text.strip(),
-                                'institution': cells[1].text.strip(),
-                                'action': cells[2].text.strip(),
-                                'shares': cells[3].text.strip()
-                            })
-                
-                return institutional_data
+            body, charset = await self.fetch_page(url, FINVIZ_TTL, self.headers)
+            tree = _html_tree(body, charset)
+            
+            institutional_data = {
+                'ticker': ticker,
+                'source': 'finviz',
+                'ownership': {},
+                'recent_transactions': []
+            }
+            
+            # Get ownership percentages from snapshot table
+            snapshot_tables = tree.xpath(_FINVIZ_SNAPSHOT_XPATH)
+            if snapshot_tables:
+                for row in snapshot_tables[0].iterdescendants('tr'):
+                    cells = _cell_texts(row)
+                    for label, value in zip(cells[::2], cells[1::2]):
+                        key = next((key for fragment, key in _OWNERSHIP_LABELS.items() if fragment in label), None)
+                        if key:
+                            institutional_data['ownership'][key] = value
+            
+            # Get recent institutional transactions
+            inst_tables = tree.xpath(_FINVIZ_RATINGS_XPATH)
+            if inst_tables:
+                for row in inst_tables[0].xpath('.//tr')[1:]:  # Skip header
+                    cells = _cell_texts(row)
+                    if len(cells) >= 4:
+                        institutional_data['recent_transactions'].append({
+                            'date': cells[0],
+                            'institution': cells[1],
+                            'action': cells[2],
+                            'shares': cells[3]
+                        })
+            
+            return institutional_data
         
         except Exception as e:
             return {'error': f"Failed to scrape Finviz institutional data: {str(e)}"}
@@ -143,36 +300,35 @@ class InstitutionalScraper:
         url = f"https://www.nasdaq.com/market-activity/stocks/{ticker.lower()}/institutional-holdings"
         
         try:
-            async with self.session.get(url, headers=self.headers) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                holdings_data = {
-                    'ticker': ticker,
-                    'source': 'nasdaq',
-                    'top_holders': [],
-                    'summary': {}
-                }
-                
-                # Look for institutional holdings table
-                tables = soup.find_all('table')
-                for table in tables:
-                    rows = table.find_all('tr')
-                    if len(rows) > 1:
-                        headers = [th.text.strip() for th in rows[0].find_all('th')]
-                        
-                        if 'HOLDER' in [h.upper() for h in headers]:
-                            # This is the holdings table
-                            for row in rows[1:11]:  # Top 10 holders
-                                cells = row.find_all('td')
-                                if len(cells) >= 3:
-                                    holdings_data['top_holders'].append({
-                                        'institution': cells[0].text.strip(),
-                                        'shares': cells[1].text.strip(),
-                                        'percentage': cells[2].text.strip()
-                                    })
-                
-                return holdings_data
+            body, charset = await self.fetch_page(url, NASDAQ_TTL, self.headers)
+            soup = BeautifulSoup(body, PARSER, from_encoding=charset, parse_only=_TABLE_STRAINER)
+            
+            holdings_data = {
+                'ticker': ticker,
+                'source': 'nasdaq',
+                'top_holders': [],
+                'summary': {}
+            }
+            
+            # Look for institutional holdings table
+            tables = soup.find_all('table')
+            for table in tables:
+                rows = table.find_all('tr')
+                if len(rows) > 1:
+                    headers = [th.text.strip() for th in rows[0].find_all('th')]
+                    
+                    if 'HOLDER' in [h.upper() for h in headers]:
+                        # This is the holdings table
+                        for row in rows[1:11]:  # Top 10 holders
+                            cells = row.find_all('td')
+                            if len(cells) >= 3:
+                                holdings_data['top_holders'].append({
+                                    'institution': cells[0].text.strip(),
+                                    'shares': cells[1].text.strip(),
+                                    'percentage': cells[2].text.strip()
+                                })
+            
+            return holdings_data
         
         except Exception as e:
             return {'error': f"Failed to scrape NASDAQ institutional data: {str(e)}"}
@@ -183,69 +339,64 @@ class InstitutionalScraper:
         search_url = f"https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&CIK={cik}&type=13F"
         
         try:
-            async with self.session.get(search_url, headers=self.sec_headers) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                filings_data = {
-                    'cik': cik,
-                    'source': 'sec_13f',
-                    'recent_filings': [],
-                    'holdings': []
-                }
+            body, charset = await self.fetch_page(search_url, SEC_INDEX_TTL, self.sec_headers)
+            tree = _html_tree(body, charset)
+            
+            filings_data = {
+                'cik': cik,
+                'source': 'sec_13f',
+                'recent_filings': [],
+                'holdings': []
+            }
+            
+            # Find filing links
+            filing_tables = tree.xpath(_SEC_TABLE_FILE_XPATH) or tree.xpath(_SEC_DOCUMENT_XPATH)
+            if filing_tables:
+                for row in filing_tables[0].xpath('.//tr')[1:6]:  # Get recent 5 filings
+                    cells = list(row.iterdescendants('td'))
+                    if len(cells) >= 4:
+                        filing_link = next(cells[1].iterdescendants('a'), None)
+                        if filing_link is not None:
+                            filings_data['recent_filings'].append({
+                                'filing_date': cells[3].text_content().strip(),
+                                'form_type': cells[0].text_content().strip(),
+                                'description': cells[2].text_content().strip(),
+                                'link': 'https://www.sec.gov' + filing_link.get('href', '')
+                            })
+            
+            # If ticker provided, try to find specific holdings
+            if ticker and filings_data['recent_filings']:
+                # Get the most recent filing
+                latest_filing_url = filings_data['recent_filings'][0]['link']
+                body, charset = await self.fetch_page(latest_filing_url, SEC_FILING_TTL, self.sec_headers)
                 
-                # Find filing links
-                filing_table = soup.find('table', {'class': re.compile('tableFile')}) or soup.find('table', {'summary': re.compile('Document')})
-                if filing_table:
-                    rows = filing_table.find_all('tr')[1:6]  # Get recent 5 filings
+                # Look for the information table link
+                info_table_link = next(
+                    (a for a in _html_tree(body, charset).iter('a') if _RE_INFO_TABLE.search(a.text_content())), None
+                )
+                if info_table_link is not None:
+                    info_table_url = 'https://www.sec.gov' + info_table_link.get('href', '')
                     
-                    for row in rows:
-                        cells = row.find_all('td')
-                        if len(cells) >= 4:
-                            filing_link = cells[1].find('a')
-                            if filing_link:
-                                filings_data['recent_filings'].append({
-                                    'filing_date': cells[3].text.strip(),
-                                    'form_type': cells[0].text.strip(),
-                                    'description': cells[2].text.strip(),
-                                    'link': 'https://www.sec.gov' + filing_link.get('href', '')
-                                })
-                
-                # If ticker provided, try to find specific holdings
-                if ticker and filings_data['recent_filings']:
-                    # Get the most recent filing
-                    latest_filing_url = filings_data['recent_filings'][0]['link']
-                    async with self.session.get(latest_filing_url, headers=self.sec_headers) as filing_response:
-                        filing_html = await filing_response.text()
-                        filing_soup = BeautifulSoup(filing_html, 'html.parser')
-                        
-                        # Look for the information table link
-                        info_table_link = filing_soup.find('a', text=re.compile('INFORMATION TABLE', re.I))
-                        if info_table_link:
-                            info_table_url = 'https://www.sec.gov' + info_table_link.get('href', '')
-                            
-                            async with self.session.get(info_table_url, headers=self.sec_headers) as table_response:
-                                table_html = await table_response.text()
-                                table_soup = BeautifulSoup(table_html, 'html.parser')
-                                
-                                # Parse holdings table
-                                holdings_table = table_soup.find('table')
-                                if holdings_table:
-                                    for row in holdings_table.find_all('tr')[1:]:
-                                        cells = row.find_all('td')
-                                        if len(cells) >= 7:
-                                            issuer_name = cells[0].text.strip()
-                                            if ticker.upper() in issuer_name.upper():
-                                                filings_data['holdings'].append({
-                                                    'issuer': issuer_name,
-                                                    'class': cells[1].text.strip(),
-                                                    'cusip': cells[2].text.strip(),
-                                                    'value': cells[3].text.strip(),
-                                                    'shares': cells[4].text.strip(),
-                                                    'type': cells[5].text.strip()
-                                                })
-                
-                return filings_data
+                    body, charset = await self.fetch_page(info_table_url, SEC_FILING_TTL, self.sec_headers)
+                    
+                    # Parse holdings table
+                    holdings_tables = _html_tree(body, charset).xpath('(//table)[1]')
+                    if holdings_tables:
+                        for row in holdings_tables[0].xpath('.//tr')[1:]:
+                            cells = _cell_texts(row)
+                            if len(cells) >= 7:
+                                issuer_name = cells[0]
+                                if ticker.upper() in issuer_name.upper():
+                                    filings_data['holdings'].append({
+                                        'issuer': issuer_name,
+                                        'class': cells[1],
+                                        'cusip': cells[2],
+                                        'value': cells[3],
+                                        'shares': cells[4],
+                                        'type': cells[5]
+                                    })
+            
+            return filings_data
         
         except Exception as e:
             return {'error': f"Failed to scrape SEC 13F data: {str(e)}"}
@@ -256,60 +407,46 @@ class InstitutionalScraper:
         openinsider_url = f"http://openinsider.com/search?q={ticker}"
         
         try:
-            async with self.session.get(openinsider_url, headers=self.headers) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                insider_data = {
-                    'ticker': ticker,
-                    'source': 'openinsider',
-                    'recent_transactions': [],
-                    'summary': {
-                        'total_bought': 0,
-                        'total_sold': 0,
-                        'net_activity': 0
-                    }
+            body, charset = await self.fetch_page(openinsider_url, OPENINSIDER_TTL, self.headers)
+            tree = _html_tree(body, charset)
+            
+            insider_data = {
+                'ticker': ticker,
+                'source': 'openinsider',
+                'recent_transactions': [],
+                'summary': {
+                    'total_bought': 0,
+                    'total_sold': 0,
+                    'net_activity': 0
                 }
-                
-                # Find the insider trading table
-                tables = soup.find_all('table', {'class': 'tinytable'})
-                if tables:
-                    for table in tables:
-                        rows = table.find_all('tr')[1:]  # Skip header
-                        for row in rows[:20]:  # Get recent 20 transactions
-                            cells = row.find_all('td')
-                            if len(cells) >= 10:
-                                transaction = {
-                                    'filing_date': cells[1].text.strip(),
-                                    'trade_date': cells[2].text.strip(),
-                                    'ticker': cells[3].text.strip(),
-                                    'insider_name': cells[4].text.strip(),
-                                    'title': cells[5].text.strip(),
-                                    'trade_type': cells[6].text.strip(),
-                                    'price': cells[7].text.strip(),
-                                    'quantity': cells[8].text.strip(),
-                                    'owned': cells[9].text.strip(),
-                                    'value': cells[10].text.strip() if len(cells) > 10 else ''
-                                }
-                                
-                                insider_data['recent_transactions'].append(transaction)
-                                
-                                # Update summary
-                                try:
-                                    qty = int(transaction['quantity'].replace(',', '').replace('+', ''))
-                                    if 'Buy' in transaction['trade_type']:
-                                        insider_data['summary']['total_bought'] += qty
-                                    elif 'Sale' in transaction['trade_type']:
-                                        insider_data['summary']['total_sold'] += qty
-                                except:
-                                    pass
-                
-                insider_data['summary']['net_activity'] = (
-                    insider_data['summary']['total_bought'] - 
-                    insider_data['summary']['total_sold']
-                )
-                
-                return insider_data
+            }
+            
+            # Find the insider trading table; the column layout is fixed, so each row maps positionally
+            transactions = insider_data['recent_transactions']
+            for table in tree.xpath(_OPENINSIDER_XPATH):
+                for row in table.xpath(_OPENINSIDER_ROWS_XPATH):
+                    cells = _cell_texts(row)
+                    if len(cells) >= 10:
+                        # Rows without the trailing value column get ''
+                        transactions.append(dict(zip(_OPENINSIDER_FIELDS, (cells + [''])[1:11])))
+            
+            # Update summary in one pass; blank or non-numeric quantities are skipped
+            summary = insider_data['summary']
+            for transaction in transactions:
+                quantity = transaction['quantity'].replace(',', '').replace('+', '')
+                if not _INT_RE.fullmatch(quantity):
+                    continue
+                if 'Buy' in transaction['trade_type']:
+                    summary['total_bought'] += int(quantity)
+                elif 'Sale' in transaction['trade_type']:
+                    summary['total_sold'] += int(quantity)
+            
+            insider_data['summary']['net_activity'] = (
+                insider_data['summary']['total_bought'] - 
+                insider_data['summary']['total_sold']
+            )
+            
+            return insider_data
         
         except Exception as e:
             return {'error': f"Failed to scrape insider trading data: {str(e)}"}
@@ -317,8 +454,10 @@ class InstitutionalScraper:
     async def get_institutional_changes(self, ticker: str) -> Dict[str, Any]:
         """Track institutional ownership changes over time"""
         # Combine data from multiple sources
-        finviz_data = await self.scrape_finviz_institutional(ticker)
-        nasdaq_data = await self.scrape_nasdaq_institutional(ticker)
+        finviz_data, nasdaq_data = await gather_sources(
+            self.scrape_finviz_institutional(ticker),
+            self.scrape_nasdaq_institutional(ticker)
+        )
         
         changes_data = {
             'ticker': ticker,
@@ -345,34 +484,33 @@ class InstitutionalScraper:
         url = f"https://whalewisdom.com/filer/{search_query}"
         
         try:
-            async with self.session.get(url, headers=self.headers) as response:
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                fund_data = {
-                    'fund_name': fund_name,
-                    'source': 'whalewisdom',
-                    'top_holdings': [],
-                    'recent_activity': []
-                }
-                
-                # This is a simplified example - actual implementation would need
-                # to handle the specific structure of the site
-                holdings_table = soup.find('table', {'id': 'current_holdings_table'})
-                if holdings_table:
-                    rows = holdings_table.find_all('tr')[1:21]  # Top 20 holdings
-                    for row in rows:
-                        cells = row.find_all('td')
-                        if len(cells) >= 5:
-                            fund_data['top_holdings'].append({
-                                'stock': cells[0].text.strip(),
-                                'shares': cells[1].text.strip(),
-                                'value': cells[2].text.strip(),
-                                'percentage': cells[3].text.strip(),
-                                'change': cells[4].text.strip()
-                            })
-                
-                return fund_data
+            body, charset = await self.fetch_page(url, WHALEWISDOM_TTL, self.headers)
+            soup = BeautifulSoup(body, PARSER, from_encoding=charset, parse_only=_WHALEWISDOM_STRAINER)
+            
+            fund_data = {
+                'fund_name': fund_name,
+                'source': 'whalewisdom',
+                'top_holdings': [],
+                'recent_activity': []
+            }
+            
+            # This is a simplified example - actual implementation would need
+            # to handle the specific structure of the site
+            holdings_table = soup.find('table', {'id': 'current_holdings_table'})
+            if holdings_table:
+                rows = holdings_table.find_all('tr')[1:21]  # Top 20 holdings
+                for row in rows:
+                    cells = row.find_all('td')
+                    if len(cells) >= 5:
+                        fund_data['top_holdings'].append({
+                            'stock': cells[0].text.strip(),
+                            'shares': cells[1].text.strip(),
+                            'value': cells[2].text.strip(),
+                            'percentage': cells[3].text.strip(),
+                            'change': cells[4].text.strip()
+                        })
+            
+            return fund_data
         
         except Exception as e:
             return {'error': f"Failed to scrape fund holdings: {str(e)}"}
@@ -464,15 +602,15 @@ async def list_tools() -> List[Tool]:
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> List[TextContent]:
-    await scraper.setup()
-    
     try:
         if name == "get_institutional_ownership":
             ticker = arguments["ticker"].upper()
             
             # Get data from multiple sources
-            finviz_data = await scraper.scrape_finviz_institutional(ticker)
-            nasdaq_data = await scraper.scrape_nasdaq_institutional(ticker)
+            finviz_data, nasdaq_data = await gather_sources(
+                scraper.scrape_finviz_institutional(ticker),
+                scraper.scrape_nasdaq_institutional(ticker)
+            )
             
             combined_data = {
                 'ticker': ticker,
@@ -520,8 +658,10 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
             ticker = arguments["ticker"].upper()
             
             # Get comprehensive holder data
-            nasdaq_data = await scraper.scrape_nasdaq_institutional(ticker)
-            finviz_data = await scraper.scrape_finviz_institutional(ticker)
+            nasdaq_data, finviz_data = await gather_sources(
+                scraper.scrape_nasdaq_institutional(ticker),
+                scraper.scrape_finviz_institutional(ticker)
+            )
             
             holders_data = {
                 'ticker': ticker,
@@ -549,16 +689,21 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
         )]
 
 async def main():
-    async with stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="institutional-scraper",
-                server_version="0.1.0",
-                capabilities={}
+    # One session for the server's lifetime keeps connections and DNS lookups warm between tool calls
+    await scraper.setup()
+    try:
+        async with stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="institutional-scraper",
+                    server_version="0.1.0",
+                    capabilities={}
+                )
             )
-        )
+    finally:
+        await scraper.cleanup()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
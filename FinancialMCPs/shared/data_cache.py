@@ -5,6 +5,7 @@ Implements intelligent caching with TTL and data versioning
 """
 
 import json
+import logging
 import sqlite3
 import hashlib
 from datetime import datetime, timedelta
@@ -14,6 +15,9 @@ import pickle
 import asyncio
 from functools import wraps
 
+# MCP servers speak JSON-RPC over stdout, so cache problems are logged (stderr) rather than printed
+logger = logging.getLogger(__name__)
+
 
 class FinancialDataCache:
     """Intelligent caching system for financial data"""
@@ -83,6 +87,11 @@ class FinancialDataCache:
     async def get(self, data_type: str, ticker: str, 
                   params: Optional[Dict] = None) -> Optional[Any]:
         """Retrieve data from cache"""
+        return self.get_sync(data_type, ticker, params)
+    
+    def get_sync(self, data_type: str, ticker: str, 
+                 params: Optional[Dict] = None) -> Optional[Any]:
+        """Blocking cache read (sqlite + unpickle); event-loop callers should run it via asyncio.to_thread"""
         cache_key = self._generate_cache_key(data_type, ticker, params)
         
         # Check if entry exists and is valid
@@ -115,7 +124,7 @@ class FinancialDataCache:
                     conn.close()
                     return data
                 except Exception as e:
-                    print(f"Cache read error: {e}")
+                    logger.warning("Cache read error: %s", e)
         
         conn.close()
         return None
@@ -124,6 +133,12 @@ class FinancialDataCache:
                   params: Optional[Dict] = None, 
                   custom_ttl: Optional[timedelta] = None):
         """Store data in cache"""
+        self.set_sync(data_type, ticker, data, params, custom_ttl)
+    
+    def set_sync(self, data_type: str, ticker: str, data: Any,
+                 params: Optional[Dict] = None, 
+                 custom_ttl: Optional[timedelta] = None):
+        """Blocking cache write (pickle + sqlite); event-loop callers should run it via asyncio.to_thread"""
         cache_key = self._generate_cache_key(data_type, ticker, params)
         
         # Determine TTL
@@ -154,7 +169,7 @@ class FinancialDataCache:
             conn.close()
             
         except Exception as e:
-            print(f"Cache write error: {e}")
+            logger.warning("Cache write error: %s", e)
     
     async def invalidate(self, ticker: Optional[str] = None, 
                         data_type: Optional[str] = None):
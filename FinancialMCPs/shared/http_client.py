@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Client for Financial MCPs
+One process-wide aiohttp session with a tuned connection pool
+"""
+
+from typing import Optional
+
+import aiohttp
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5)
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared session, creating it on first use"""
+    global _session
+    
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=10,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+        _session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=DEFAULT_TIMEOUT,
+            headers=DEFAULT_HEADERS
+        )
+    
+    return _session
+
+
+async def close_session():
+    """Close the shared session; call once when the server shuts down"""
+    global _session
+    
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None